@@ -3,87 +3,159 @@ Create Synthetic Crisis Data
 Generates realistic price data based on actual historical crisis events
 """
 
-import csv
 import json
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
-import math
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# ============================================================================
+# PRICE CURVE KERNELS
+# ============================================================================
+# JIT-compiled when numba is available (cache=True amortizes the one-time
+# compile across runs), so scaling the generators to second-resolution
+# stays cheap. Without numba these are ordinary NumPy expressions.
+
+@njit(cache=True)
+def _curve_sqrt_pump(base, peak, progress):
+    """Square-root pump from base toward peak."""
+    return base + (peak - base) * np.sqrt(progress)
+
+
+@njit(cache=True)
+def _curve_quadratic_drop(peak, floor, progress):
+    """Quadratic crash from peak down toward floor."""
+    return peak - (peak - floor) * progress ** 2
+
+
+@njit(cache=True)
+def _curve_power_decline(start, drop_fraction, power, progress):
+    """Decline by drop_fraction of start, accelerating with the given power."""
+    return start * (1 - drop_fraction * progress ** power)
+
+
+@njit(cache=True)
+def _curve_exp_collapse(start, rate, floor, progress):
+    """Exponential collapse from start, floored at near-zero."""
+    return np.maximum(floor, start * np.exp(-rate * progress))
+
+
+def write_metadata_json(filepath, metadata):
+    """Write a metadata dict as indented JSON (orjson when available)."""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(metadata, f, indent=2, default=str)
+
+
+def write_price_csv(filepath, timestamps, prices):
+    """
+    Write a price series to CSV in a single buffered write.
+
+    Builds all rows up front and issues one file.write instead of
+    one writerow call per sample.
+
+    Args:
+        filepath: Output CSV path
+        timestamps: Unix timestamps (array or list of ints)
+        prices: Prices in USD (array or list of floats)
+    """
+    ts_arr = np.asarray(timestamps, dtype=np.int64)
+    # One C-level pass for the ISO strings instead of a datetime object per row
+    dt_arr = ts_arr.astype('datetime64[s]').astype('U19')
+    rows = [
+        f"{ts},{dt},{price:.6f}\n"
+        for ts, dt, price in zip(ts_arr.tolist(), dt_arr.tolist(), np.asarray(prices).tolist())
+    ]
+    # 1MiB buffer keeps the OS-level writes to a few large blocks
+    with open(filepath, 'w', newline='', buffering=1 << 20) as f:
+        f.write("timestamp,datetime,price_usd\n")
+        f.write("".join(rows))
 
 
 def generate_mango_exploit_data():
     """
     Simulate Mango Markets exploit (Oct 11, 2022)
-    
+
     Actual event: MNGO manipulated from ~$0.03 to ~$0.91 in minutes,
     then crashed back down. Oracle manipulation attack.
     """
     output_dir = Path("data/mango_exploit")
     output_dir.mkdir(parents=True, exist_ok=True)
-    
+
     # Start time: Oct 11, 2022, 17:00 UTC (1 hour before attack)
-    start_time = datetime(2022, 10, 11, 17, 0, 0)
-    
-    price_data = []
-    
+    start_ts = int(datetime(2022, 10, 11, 17, 0, 0).timestamp())
+
     # Phase 1: Stable price before attack (17:00-18:00)
     base_price = 0.0295
-    for minute in range(60):
-        timestamp = int((start_time + timedelta(minutes=minute)).timestamp())
-        price = base_price + (0.0005 * math.sin(minute / 10))  # Small fluctuations
-        price_data.append((timestamp, price))
-    
+    minute = np.arange(60)
+    ts_1 = start_ts + minute * 60
+    prices_1 = base_price + (0.0005 * np.sin(minute / 10))  # Small fluctuations
+
     # Phase 2: Rapid manipulation (18:00-18:20, 20 minutes)
-    attack_start = start_time + timedelta(hours=1)
-    for minute in range(20):
-        timestamp = int((attack_start + timedelta(minutes=minute)).timestamp())
-        # Exponential pump to $0.91
-        progress = minute / 20
-        price = base_price + (0.91 - base_price) * (progress ** 0.5)  # Square root curve
-        price_data.append((timestamp, price))
-    
+    attack_start_ts = start_ts + 3600
+    minute = np.arange(20)
+    ts_2 = attack_start_ts + minute * 60
+    # Exponential pump to $0.91
+    progress = minute / 20
+    prices_2 = _curve_sqrt_pump(base_price, 0.91, progress)  # Square root curve
+
     # Phase 3: Peak and immediate crash (18:20-18:40, 20 minutes)
-    crash_start = attack_start + timedelta(minutes=20)
+    crash_start_ts = attack_start_ts + 20 * 60
     peak_price = 0.91
-    for minute in range(20):
-        timestamp = int((crash_start + timedelta(minutes=minute)).timestamp())
-        progress = minute / 20
-        # Sharp drop back down
-        price = peak_price - (peak_price - 0.04) * (progress ** 2)  # Quadratic drop
-        price_data.append((timestamp, price))
-    
+    minute = np.arange(20)
+    ts_3 = crash_start_ts + minute * 60
+    progress = minute / 20
+    # Sharp drop back down
+    prices_3 = _curve_quadratic_drop(peak_price, 0.04, progress)  # Quadratic drop
+
     # Phase 4: Aftermath volatility (18:40-22:00, ~200 minutes)
-    aftermath_start = crash_start + timedelta(minutes=20)
-    for minute in range(200):
-        timestamp = int((aftermath_start + timedelta(minutes=minute)).timestamp())
-        # Gradual decline with high volatility
-        base = 0.04 - (0.01 * (minute / 200))
-        volatility = 0.005 * math.sin(minute / 5)
-        price = max(0.025, base + volatility)
-        price_data.append((timestamp, price))
-    
+    aftermath_start_ts = crash_start_ts + 20 * 60
+    minute = np.arange(200)
+    ts_4 = aftermath_start_ts + minute * 60
+    # Gradual decline with high volatility
+    base = 0.04 - (0.01 * (minute / 200))
+    volatility = 0.005 * np.sin(minute / 5)
+    prices_4 = np.maximum(0.025, base + volatility)
+
+    # Stack all phases into one series
+    timestamps = np.concatenate([ts_1, ts_2, ts_3, ts_4])
+    prices = np.concatenate([prices_1, prices_2, prices_3, prices_4])
+
     # Save to CSV
     filepath = output_dir / "mngo_usdc_prices.csv"
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(["timestamp", "datetime", "price_usd"])
-        for ts, price in price_data:
-            dt = datetime.fromtimestamp(ts).isoformat()
-            writer.writerow([ts, dt, f"{price:.6f}"])
-    
+    write_price_csv(filepath, timestamps, prices)
+
     # Save metadata
     metadata = {
         "event_name": "Mango Markets Exploit (Synthetic)",
         "description": "Oracle manipulation attack simulation based on actual event",
         "date": "2022-10-11",
-        "price_range": {"start": base_price, "peak": peak_price, "end": price_data[-1][1]},
-        "data_points": len(price_data),
+        "price_range": {"start": base_price, "peak": peak_price, "end": float(prices[-1])},
+        "data_points": len(prices),
         "note": "Synthetic data simulating actual price movements",
     }
-    
-    with open(output_dir / "mngo_usdc_prices_metadata.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
-    
-    print(f"✅ Created Mango exploit data: {len(price_data)} points")
+
+    write_metadata_json(output_dir / "mngo_usdc_prices_metadata.json", metadata)
+
+    print(f"✅ Created Mango exploit data: {len(prices)} points")
     return str(filepath)
 
 
@@ -97,73 +169,63 @@ def generate_luna_collapse_data():
     output_dir = Path("data/luna_collapse")
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    start_time = datetime(2022, 5, 7, 0, 0, 0)
-    
-    price_data = []
-    
+    start_ts = int(datetime(2022, 5, 7, 0, 0, 0).timestamp())
+
     # Phase 1: Pre-depeg stability (May 7, 24 hours)
     start_price = 79.5
-    for hour in range(24):
-        timestamp = int((start_time + timedelta(hours=hour)).timestamp())
-        price = start_price + (2 * math.sin(hour / 4))  # Normal volatility
-        price_data.append((timestamp, price))
-    
+    hour = np.arange(24)
+    ts_1 = start_ts + hour * 3600
+    prices_1 = start_price + (2 * np.sin(hour / 4))  # Normal volatility
+
     # Phase 2: UST depeg begins, slow decline (May 8, 24 hours)
-    day2_start = start_time + timedelta(days=1)
-    for hour in range(24):
-        timestamp = int((day2_start + timedelta(hours=hour)).timestamp())
-        progress = hour / 24
-        price = start_price - (start_price * 0.15 * progress)  # -15% first day
-        price_data.append((timestamp, price))
-    
+    day2_start_ts = start_ts + 86400
+    hour = np.arange(24)
+    ts_2 = day2_start_ts + hour * 3600
+    progress = hour / 24
+    prices_2 = start_price - (start_price * 0.15 * progress)  # -15% first day
+
     # Phase 3: Panic selling begins (May 9, 24 hours)
-    day3_start = start_time + timedelta(days=2)
-    for hour in range(24):
-        timestamp = int((day3_start + timedelta(hours=hour)).timestamp())
-        progress = hour / 24
-        current_start = start_price * 0.85
-        price = current_start * (1 - 0.40 * (progress ** 1.5))  # -40%, accelerating
-        price_data.append((timestamp, price))
-    
+    day3_start_ts = start_ts + 2 * 86400
+    hour = np.arange(24)
+    ts_3 = day3_start_ts + hour * 3600
+    progress = hour / 24
+    current_start = start_price * 0.85
+    prices_3 = _curve_power_decline(current_start, 0.40, 1.5, progress)  # -40%, accelerating
+
     # Phase 4: Death spiral (May 10-11, 48 hours)
-    day4_start = start_time + timedelta(days=3)
-    for hour in range(48):
-        timestamp = int((day4_start + timedelta(hours=hour)).timestamp())
-        progress = hour / 48
-        current_start = start_price * 0.51
-        # Exponential collapse
-        price = current_start * math.exp(-5 * progress)
-        price = max(0.0001, price)  # Floor at near-zero
-        price_data.append((timestamp, price))
-    
+    day4_start_ts = start_ts + 3 * 86400
+    hour = np.arange(48)
+    ts_4 = day4_start_ts + hour * 3600
+    progress = hour / 48
+    current_start = start_price * 0.51
+    # Exponential collapse, floored at near-zero
+    prices_4 = _curve_exp_collapse(current_start, 5.0, 0.0001, progress)
+
     # Phase 5: Near-zero aftermath (May 12-13, 24 hours)
-    day6_start = start_time + timedelta(days=5)
-    for hour in range(24):
-        timestamp = int((day6_start + timedelta(hours=hour)).timestamp())
-        price = 0.0001 + (0.00005 * math.sin(hour))  # Essentially zero
-        price_data.append((timestamp, price))
-    
+    day6_start_ts = start_ts + 5 * 86400
+    hour = np.arange(24)
+    ts_5 = day6_start_ts + hour * 3600
+    prices_5 = 0.0001 + (0.00005 * np.sin(hour))  # Essentially zero
+
+    # Stack all phases into one series
+    timestamps = np.concatenate([ts_1, ts_2, ts_3, ts_4, ts_5])
+    prices = np.concatenate([prices_1, prices_2, prices_3, prices_4, prices_5])
+
     # Save
     filepath = output_dir / "luna_usdc_prices.csv"
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(["timestamp", "datetime", "price_usd"])
-        for ts, price in price_data:
-            dt = datetime.fromtimestamp(ts).isoformat()
-            writer.writerow([ts, dt, f"{price:.6f}"])
-    
+    write_price_csv(filepath, timestamps, prices)
+
     metadata = {
         "event_name": "LUNA/UST Collapse (Synthetic)",
         "description": "Death spiral simulation based on actual collapse",
         "date_range": "2022-05-07 to 2022-05-13",
-        "price_range": {"start": start_price, "bottom": price_data[-1][1], "drop_pct": 99.99},
-        "data_points": len(price_data),
+        "price_range": {"start": start_price, "bottom": float(prices[-1]), "drop_pct": 99.99},
+        "data_points": len(prices),
     }
-    
-    with open(output_dir / "luna_usdc_prices_metadata.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
-    
-    print(f"✅ Created LUNA collapse data: {len(price_data)} points")
+
+    write_metadata_json(output_dir / "luna_usdc_prices_metadata.json", metadata)
+
+    print(f"✅ Created LUNA collapse data: {len(prices)} points")
     return str(filepath)
 
 
@@ -177,74 +239,65 @@ def generate_ftt_collapse_data():
     output_dir = Path("data/ftt_collapse")
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    start_time = datetime(2022, 11, 1, 0, 0, 0)
-    
-    price_data = []
-    
+    start_ts = int(datetime(2022, 11, 1, 0, 0, 0).timestamp())
+
     start_price = 22.0
-    
+
     # Phase 1: Normal trading (Nov 1, 24 hours)
-    for hour in range(24):
-        timestamp = int((start_time + timedelta(hours=hour)).timestamp())
-        price = start_price + (0.5 * math.sin(hour / 3))
-        price_data.append((timestamp, price))
-    
+    hour = np.arange(24)
+    ts_1 = start_ts + hour * 3600
+    prices_1 = start_price + (0.5 * np.sin(hour / 3))
+
     # Phase 2: Balance sheet leak, uncertainty (Nov 2-5, 4 days)
-    leak_start = start_time + timedelta(days=1)
-    for hour in range(96):  # 4 days
-        timestamp = int((leak_start + timedelta(hours=hour)).timestamp())
-        day_progress = hour / 96
-        price = start_price * (1 - 0.25 * day_progress)  # -25% over 4 days
-        volatility = 0.5 * math.sin(hour / 6)
-        price_data.append((timestamp, price + volatility))
-    
+    leak_start_ts = start_ts + 86400
+    hour = np.arange(96)  # 4 days
+    ts_2 = leak_start_ts + hour * 3600
+    day_progress = hour / 96
+    base = start_price * (1 - 0.25 * day_progress)  # -25% over 4 days
+    volatility = 0.5 * np.sin(hour / 6)
+    prices_2 = base + volatility
+
     # Phase 3: Binance announcement, selling pressure (Nov 6-7, 2 days)
-    binance_start = start_time + timedelta(days=5)
-    for hour in range(48):
-        timestamp = int((binance_start + timedelta(hours=hour)).timestamp())
-        progress = hour / 48
-        current_start = start_price * 0.75
-        price = current_start * (1 - 0.40 * (progress ** 1.2))  # -40%, accelerating
-        price_data.append((timestamp, price))
-    
+    binance_start_ts = start_ts + 5 * 86400
+    hour = np.arange(48)
+    ts_3 = binance_start_ts + hour * 3600
+    progress = hour / 48
+    current_start = start_price * 0.75
+    prices_3 = _curve_power_decline(current_start, 0.40, 1.2, progress)  # -40%, accelerating
+
     # Phase 4: Panic collapse (Nov 8-9, 2 days)
-    panic_start = start_time + timedelta(days=7)
-    for hour in range(48):
-        timestamp = int((panic_start + timedelta(hours=hour)).timestamp())
-        progress = hour / 48
-        current_start = start_price * 0.45
-        price = current_start * (1 - 0.75 * (progress ** 2))  # -75%, quadratic
-        price = max(2.0, price)
-        price_data.append((timestamp, price))
-    
+    panic_start_ts = start_ts + 7 * 86400
+    hour = np.arange(48)
+    ts_4 = panic_start_ts + hour * 3600
+    progress = hour / 48
+    current_start = start_price * 0.45
+    prices_4 = np.maximum(2.0, _curve_power_decline(current_start, 0.75, 2.0, progress))  # -75%, quadratic
+
     # Phase 5: Aftermath (Nov 10, 12 hours)
-    aftermath_start = start_time + timedelta(days=9)
-    for hour in range(12):
-        timestamp = int((aftermath_start + timedelta(hours=hour)).timestamp())
-        price = 2.0 + (0.3 * math.sin(hour / 2))  # Stabilized at ~$2
-        price_data.append((timestamp, price))
-    
+    aftermath_start_ts = start_ts + 9 * 86400
+    hour = np.arange(12)
+    ts_5 = aftermath_start_ts + hour * 3600
+    prices_5 = 2.0 + (0.3 * np.sin(hour / 2))  # Stabilized at ~$2
+
+    # Stack all phases into one series
+    timestamps = np.concatenate([ts_1, ts_2, ts_3, ts_4, ts_5])
+    prices = np.concatenate([prices_1, prices_2, prices_3, prices_4, prices_5])
+
     # Save
     filepath = output_dir / "ftt_usdc_prices.csv"
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(["timestamp", "datetime", "price_usd"])
-        for ts, price in price_data:
-            dt = datetime.fromtimestamp(ts).isoformat()
-            writer.writerow([ts, dt, f"{price:.6f}"])
-    
+    write_price_csv(filepath, timestamps, prices)
+
     metadata = {
         "event_name": "FTX Token Collapse (Synthetic)",
         "description": "Gradual then rapid collapse simulation",
         "date_range": "2022-11-01 to 2022-11-10",
         "price_range": {"start": start_price, "bottom": 2.0, "drop_pct": 90.9},
-        "data_points": len(price_data),
+        "data_points": len(prices),
     }
-    
-    with open(output_dir / "ftt_usdc_prices_metadata.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
-    
-    print(f"✅ Created FTT collapse data: {len(price_data)} points")
+
+    write_metadata_json(output_dir / "ftt_usdc_prices_metadata.json", metadata)
+
+    print(f"✅ Created FTT collapse data: {len(prices)} points")
     return str(filepath)
 
 
@@ -253,9 +306,15 @@ if __name__ == "__main__":
     print("🔬 Generating Synthetic Crisis Data")
     print("="*70 + "\n")
     
-    mango_path = generate_mango_exploit_data()
-    luna_path = generate_luna_collapse_data()
-    ftt_path = generate_ftt_collapse_data()
+    # The three generators are independent and CPU-bound, so run them in
+    # parallel processes: wall time is the slowest generator, not the sum
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(generate_mango_exploit_data),
+            executor.submit(generate_luna_collapse_data),
+            executor.submit(generate_ftt_collapse_data),
+        ]
+        mango_path, luna_path, ftt_path = [future.result() for future in futures]
     
     print("\n" + "="*70)
     print("✅ All Synthetic Data Generated!")
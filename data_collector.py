@@ -3,14 +3,27 @@ Data Collector - Historical Crisis Data
 Fetches price data from CoinGecko API for DeFi crisis scenarios
 """
 
+import functools
 import requests
+import threading
 import time
 import json
-import csv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from pathlib import Path
-from config import float_to_nad
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+from config import NAD
 
 
 # ============================================================================
@@ -18,7 +31,29 @@ from config import float_to_nad
 # ============================================================================
 
 COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
-RATE_LIMIT_DELAY = 1.5  # Seconds between requests (free tier: ~50 calls/min)
+RATE_LIMIT_MIN_REMAINING = 5  # Sleep only when the per-minute budget runs low
+
+# Shared session: reuses the keep-alive connection across collectors
+# (one TLS handshake total) and backs off automatically on 429/5xx.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=1.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+
+# CoinGecko's free-tier rate limit is per-IP, so even concurrent collectors
+# must issue their HTTP requests one at a time.
+_REQUEST_GATE = threading.Semaphore(1)
+
+# On-disk response cache so reruns skip the network (and rate-limit delay)
+# entirely. Historical crisis data never changes, but cap freshness anyway.
+API_CACHE_DIR = Path("data/.api_cache")
+API_CACHE_MAX_AGE = 7 * 86400  # Seconds before a cached response goes stale
 
 
 # ============================================================================
@@ -29,6 +64,7 @@ CRISIS_EVENTS = {
     "mango_exploit": {
         "name": "Mango Markets Exploit",
         "coin_id": "mango-markets",
+        "csv_name": "mngo_usdc_prices.csv",
         "start_date": datetime(2022, 10, 10),  # Day before
         "end_date": datetime(2022, 10, 13),    # Day after
         "description": "Oracle manipulation attack, $110M loss",
@@ -43,6 +79,7 @@ CRISIS_EVENTS = {
     "luna_collapse": {
         "name": "LUNA/UST Death Spiral",
         "coin_id": "terra-luna",
+        "csv_name": "luna_usdc_prices.csv",
         "start_date": datetime(2022, 5, 5),
         "end_date": datetime(2022, 5, 15),
         "description": "$40B+ ecosystem collapse, death spiral",
@@ -57,6 +94,7 @@ CRISIS_EVENTS = {
     "ftt_collapse": {
         "name": "FTX Token Collapse",
         "coin_id": "ftx-token",
+        "csv_name": "ftt_usdc_prices.csv",
         "start_date": datetime(2022, 11, 1),
         "end_date": datetime(2022, 11, 12),
         "description": "Gradual then rapid crash, liquidity crisis",
@@ -75,6 +113,16 @@ CRISIS_EVENTS = {
 # API FUNCTIONS
 # ============================================================================
 
+def _load_cached_response(cache_path: Path) -> Optional[Dict]:
+    """Load a cached API response ({"etag": ..., "data": ...}) or None."""
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=32)
 def fetch_coingecko_market_chart(
     coin_id: str,
     start_timestamp: int,
@@ -83,245 +131,295 @@ def fetch_coingecko_market_chart(
 ) -> Optional[Dict]:
     """
     Fetch historical market data from CoinGecko.
-    
+
+    Responses are memoized in-process (lru_cache) and cached on disk
+    keyed by (coin_id, range, currency), so repeated runs skip the
+    network round-trip and rate-limit delay. Stale cache entries are
+    revalidated with If-None-Match when an ETag is available.
+
     Args:
         coin_id: CoinGecko coin identifier (e.g., "mango-markets")
         start_timestamp: Start unix timestamp
         end_timestamp: End unix timestamp
         vs_currency: Quote currency (default: "usd")
-    
+
     Returns:
         API response dict or None if error
     """
+    cache_path = API_CACHE_DIR / f"{coin_id}_{vs_currency}_{start_timestamp}_{end_timestamp}.json"
+
+    cached = None
+    if cache_path.exists():
+        cached = _load_cached_response(cache_path)
+        if cached and (time.time() - cache_path.stat().st_mtime) < API_CACHE_MAX_AGE:
+            print(f"💾 Using cached {coin_id} data ({len(cached['data'].get('prices', []))} price points)")
+            return cached["data"]
+
     url = f"{COINGECKO_API_BASE}/coins/{coin_id}/market_chart/range"
-    
+
     params = {
         "vs_currency": vs_currency,
         "from": start_timestamp,
         "to": end_timestamp
     }
-    
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
     try:
         print(f"📡 Fetching {coin_id} data from {datetime.fromtimestamp(start_timestamp)} to {datetime.fromtimestamp(end_timestamp)}...")
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
+        with _REQUEST_GATE:
+            response = SESSION.get(url, params=params, headers=headers, timeout=30)
+            response.raise_for_status()
+            # Sleep only when the server says the budget is nearly spent,
+            # instead of an unconditional fixed delay after every request
+            remaining = int(response.headers.get("x-ratelimit-remaining", 50))
+            if remaining < RATE_LIMIT_MIN_REMAINING:
+                reset = float(response.headers.get("x-ratelimit-reset", 0))
+                time.sleep(max(0.0, reset - time.time()))
+
+        if response.status_code == 304 and cached:
+            # Unchanged upstream: refresh the cache timestamp and reuse
+            cache_path.touch()
+            print(f"💾 Cache revalidated for {coin_id}")
+            return cached["data"]
+
         data = response.json()
         print(f"✅ Received {len(data.get('prices', []))} price points")
-        
+
+        API_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump({"etag": response.headers.get("ETag"), "data": data}, f)
+
         return data
-    
+
     except requests.exceptions.RequestException as e:
         print(f"❌ Error fetching data: {e}")
         return None
 
 
-def process_price_data(raw_data: Dict) -> List[Tuple[int, float]]:
+class PriceSeries(NamedTuple):
+    """Price series as parallel arrays, sorted by timestamp."""
+    timestamps: np.ndarray  # int64 unix seconds
+    prices: np.ndarray  # float64 USD
+
+    def to_tuples(self) -> List[Tuple[int, float]]:
+        """Materialize as a list of (timestamp, price) tuples."""
+        return list(zip(self.timestamps.tolist(), self.prices.tolist()))
+
+
+def process_price_data(raw_data: Dict) -> PriceSeries:
     """
     Process CoinGecko API response into clean price data.
-    
+
     Args:
         raw_data: CoinGecko API response
-    
+
     Returns:
-        List of (timestamp_seconds, price_usd) tuples
+        PriceSeries of (timestamp_seconds, price_usd) arrays
     """
-    if not raw_data or "prices" not in raw_data:
-        return []
-    
+    if not raw_data or not raw_data.get("prices"):
+        return PriceSeries(np.empty(0, dtype=np.int64), np.empty(0))
+
     # CoinGecko returns [timestamp_ms, price]
-    prices = raw_data["prices"]
-    
-    # Convert to (timestamp_seconds, price) and sort
-    processed = [
-        (int(ts_ms / 1000), price)
-        for ts_ms, price in prices
+    raw = np.asarray(raw_data["prices"], dtype=np.float64)
+
+    # Convert to timestamp seconds
+    timestamps = (raw[:, 0] // 1000).astype(np.int64)
+    prices = raw[:, 1]
+
+    # CoinGecko already returns ascending timestamps; only pay for the
+    # argsort when that assumption fails (one SIMD monotonicity pass)
+    if not np.all(np.diff(timestamps) >= 0):
+        order = np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[order]
+        prices = prices[order]
+
+    return PriceSeries(timestamps, prices)
+
+
+def _fetch_range_chunks(
+    coin_id: str,
+    start_timestamp: int,
+    end_timestamp: int,
+    chunk_days: int = 1,
+    vs_currency: str = "usd"
+) -> Optional[PriceSeries]:
+    """
+    Fetch a long range as per-day sub-range requests.
+
+    CoinGecko coarsens granularity as the requested span grows (multi-day
+    ranges come back hourly), so chopping the range into one-day chunks
+    returns finer-grained data. The chunks are submitted concurrently;
+    _REQUEST_GATE still serializes the HTTP requests themselves, but
+    response parsing and processing overlap.
+
+    Args:
+        coin_id: CoinGecko coin identifier
+        start_timestamp: Range start (unix seconds)
+        end_timestamp: Range end (unix seconds)
+        chunk_days: Sub-range size in days
+        vs_currency: Quote currency
+
+    Returns:
+        Deduplicated PriceSeries covering the full range, or None if any
+        chunk failed
+    """
+    chunk_seconds = chunk_days * 86400
+    bounds = [
+        (chunk_start, min(chunk_start + chunk_seconds, end_timestamp))
+        for chunk_start in range(start_timestamp, end_timestamp, chunk_seconds)
     ]
-    
-    processed.sort(key=lambda x: x[0])
-    
-    return processed
+
+    with ThreadPoolExecutor(max_workers=min(8, len(bounds))) as executor:
+        futures = [
+            executor.submit(fetch_coingecko_market_chart, coin_id, s, e, vs_currency)
+            for s, e in bounds
+        ]
+        raw_chunks = [future.result() for future in futures]
+
+    if any(raw is None for raw in raw_chunks):
+        return None
+
+    series_chunks = [process_price_data(raw) for raw in raw_chunks]
+    timestamps = np.concatenate([s.timestamps for s in series_chunks])
+    prices = np.concatenate([s.prices for s in series_chunks])
+
+    # Adjacent sub-ranges overlap at their boundaries; np.unique sorts and
+    # keeps the first sample for each timestamp
+    timestamps, first_index = np.unique(timestamps, return_index=True)
+    return PriceSeries(timestamps, prices[first_index])
 
 
 def save_price_data_csv(
-    price_data: List[Tuple[int, float]],
+    price_data,
     filepath: str,
     metadata: Optional[Dict] = None
 ):
     """
     Save price data to CSV file.
-    
+
     Args:
-        price_data: List of (timestamp, price) tuples
+        price_data: PriceSeries or list of (timestamp, price) tuples
         filepath: Output CSV file path
         metadata: Optional metadata to save alongside
     """
+    if isinstance(price_data, PriceSeries):
+        ts_arr = price_data.timestamps
+        prices = price_data.prices.tolist()
+    else:
+        price_data = list(price_data)
+        ts_arr = np.fromiter((ts for ts, _ in price_data), dtype=np.int64, count=len(price_data))
+        prices = [price for _, price in price_data]
+
     # Create directory if needed
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+
+    # One C-level pass for the ISO strings instead of a datetime object
+    # per row, then one buffered write for the whole file
+    dt_arr = ts_arr.astype('datetime64[s]').astype('U19')
+    rows = [
+        f"{timestamp},{dt},{price}\n"
+        for timestamp, dt, price in zip(ts_arr.tolist(), dt_arr.tolist(), prices)
+    ]
+    # 1MiB buffer keeps the OS-level writes to a few large blocks
+    with open(filepath, 'w', newline='', buffering=1 << 20) as f:
+        f.write("timestamp,datetime,price_usd\n")
+        f.write("".join(rows))
+
+    print(f"💾 Saved {len(rows)} price points to {filepath}")
     
-    # Write CSV
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(["timestamp", "datetime", "price_usd"])
-        
-        for timestamp, price in price_data:
-            dt = datetime.fromtimestamp(timestamp).isoformat()
-            writer.writerow([timestamp, dt, price])
-    
-    print(f"💾 Saved {len(price_data)} price points to {filepath}")
-    
-    # Save metadata if provided
+    # Save metadata if provided (orjson serializes ~5-10x faster)
     if metadata:
         metadata_path = filepath.replace(".csv", "_metadata.json")
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2, default=str)
+        if orjson is not None:
+            with open(metadata_path, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(metadata_path, 'w') as f:
+                json.dump(metadata, f, indent=2, default=str)
         print(f"💾 Saved metadata to {metadata_path}")
 
 
-def load_price_data_csv(filepath: str) -> List[Tuple[int, int]]:
+# Row layout returned by load_price_data_csv: rows unpack like the old
+# (timestamp, price_nad) tuples but live in one contiguous int64 block
+PRICE_DTYPE = np.dtype([
+    ('timestamp', 'i8'),
+    ('price_nad', 'i8'),
+])
+
+
+def load_price_data_csv(filepath: str) -> np.ndarray:
     """
     Load price data from CSV and convert to NAD-scaled.
-    
+
     Args:
         filepath: CSV file path
-    
+
     Returns:
-        List of (timestamp, price_nad) tuples
+        Structured int64 array (PRICE_DTYPE); each row unpacks as
+        (timestamp, price_nad), so tuple-style consumers keep working.
+        Scalar consumers should int() the fields before bigint math —
+        NAD-scaled products overflow raw int64
     """
-    price_data = []
-    
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            timestamp = int(row["timestamp"])
-            price_usd = float(row["price_usd"])
-            price_nad = float_to_nad(price_usd)
-            price_data.append((timestamp, price_nad))
-    
-    return price_data
+    df = pd.read_csv(filepath, usecols=["timestamp", "price_usd"])
+
+    series = np.empty(len(df), dtype=PRICE_DTYPE)
+    series['timestamp'] = df["timestamp"].to_numpy(np.int64)
+    # One SIMD multiply-and-cast for the whole column; astype truncates
+    # toward zero, matching float_to_nad's int() semantics
+    series['price_nad'] = (
+        df["price_usd"].to_numpy(np.float64) * NAD
+    ).astype(np.int64)
+
+    return series
 
 
 # ============================================================================
 # CRISIS-SPECIFIC COLLECTORS
 # ============================================================================
 
-def collect_mango_exploit_data(output_dir: str = "data/mango_exploit") -> str:
-    """
-    Collect Mango Markets exploit data (Oct 11-12, 2022).
-    
-    Returns:
-        Path to saved CSV file
+def collect_event(event_key: str, output_dir: Optional[str] = None) -> str:
     """
-    event = CRISIS_EVENTS["mango_exploit"]
-    
-    start_ts = int(event["start_date"].timestamp())
-    end_ts = int(event["end_date"].timestamp())
-    
-    # Fetch data
-    raw_data = fetch_coingecko_market_chart(
-        coin_id=event["coin_id"],
-        start_timestamp=start_ts,
-        end_timestamp=end_ts
-    )
-    
-    if not raw_data:
-        print("❌ Failed to collect Mango exploit data")
-        return ""
-    
-    # Process and save
-    price_data = process_price_data(raw_data)
-    filepath = f"{output_dir}/mngo_usdc_prices.csv"
-    
-    save_price_data_csv(
-        price_data=price_data,
-        filepath=filepath,
-        metadata={
-            "event_name": event["name"],
-            "description": event["description"],
-            "coin_id": event["coin_id"],
-            "date_range": f"{event['start_date']} to {event['end_date']}",
-            "key_timestamps": event["key_timestamps"],
-            "source": "CoinGecko API",
-            "collected_at": datetime.now().isoformat(),
-        }
-    )
-    
-    time.sleep(RATE_LIMIT_DELAY)
-    return filepath
+    Collect price data for one crisis event from CRISIS_EVENTS.
 
+    Args:
+        event_key: Key into CRISIS_EVENTS (e.g., "mango_exploit")
+        output_dir: Output directory (defaults to data/<event_key>)
 
-def collect_luna_collapse_data(output_dir: str = "data/luna_collapse") -> str:
-    """
-    Collect LUNA collapse data (May 7-15, 2022).
-    
     Returns:
-        Path to saved CSV file
+        Path to saved CSV file, or "" on failure
     """
-    event = CRISIS_EVENTS["luna_collapse"]
-    
-    start_ts = int(event["start_date"].timestamp())
-    end_ts = int(event["end_date"].timestamp())
-    
-    # Fetch data
-    raw_data = fetch_coingecko_market_chart(
-        coin_id=event["coin_id"],
-        start_timestamp=start_ts,
-        end_timestamp=end_ts
-    )
-    
-    if not raw_data:
-        print("❌ Failed to collect LUNA collapse data")
-        return ""
-    
-    # Process and save
-    price_data = process_price_data(raw_data)
-    filepath = f"{output_dir}/luna_usdc_prices.csv"
-    
-    save_price_data_csv(
-        price_data=price_data,
-        filepath=filepath,
-        metadata={
-            "event_name": event["name"],
-            "description": event["description"],
-            "coin_id": event["coin_id"],
-            "date_range": f"{event['start_date']} to {event['end_date']}",
-            "key_timestamps": event["key_timestamps"],
-            "source": "CoinGecko API",
-            "collected_at": datetime.now().isoformat(),
-        }
-    )
-    
-    time.sleep(RATE_LIMIT_DELAY)
-    return filepath
+    event = CRISIS_EVENTS[event_key]
 
+    if output_dir is None:
+        output_dir = f"data/{event_key}"
 
-def collect_ftt_collapse_data(output_dir: str = "data/ftt_collapse") -> str:
-    """
-    Collect FTT collapse data (Nov 1-12, 2022).
-    
-    Returns:
-        Path to saved CSV file
-    """
-    event = CRISIS_EVENTS["ftt_collapse"]
-    
     start_ts = int(event["start_date"].timestamp())
     end_ts = int(event["end_date"].timestamp())
-    
-    # Fetch data
-    raw_data = fetch_coingecko_market_chart(
-        coin_id=event["coin_id"],
-        start_timestamp=start_ts,
-        end_timestamp=end_ts
-    )
-    
-    if not raw_data:
-        print("❌ Failed to collect FTT collapse data")
+
+    # Fetch data: multi-day ranges are chunked per day for finer
+    # granularity and parallel fetching
+    if end_ts - start_ts > 86400:
+        price_data = _fetch_range_chunks(
+            coin_id=event["coin_id"],
+            start_timestamp=start_ts,
+            end_timestamp=end_ts
+        )
+    else:
+        raw_data = fetch_coingecko_market_chart(
+            coin_id=event["coin_id"],
+            start_timestamp=start_ts,
+            end_timestamp=end_ts
+        )
+        price_data = process_price_data(raw_data) if raw_data else None
+
+    if price_data is None or len(price_data.timestamps) == 0:
+        print(f"❌ Failed to collect {event['name']} data")
         return ""
-    
-    # Process and save
-    price_data = process_price_data(raw_data)
-    filepath = f"{output_dir}/ftt_usdc_prices.csv"
-    
+    filepath = f"{output_dir}/{event['csv_name']}"
+
     save_price_data_csv(
         price_data=price_data,
         filepath=filepath,
@@ -335,8 +433,7 @@ def collect_ftt_collapse_data(output_dir: str = "data/ftt_collapse") -> str:
             "collected_at": datetime.now().isoformat(),
         }
     )
-    
-    time.sleep(RATE_LIMIT_DELAY)
+
     return filepath
 
 
@@ -348,23 +445,26 @@ def collect_all_crisis_data():
     print("📊 Collecting Historical Crisis Data")
     print("="*70 + "\n")
     
-    results = {}
-    
-    # Mango Markets
-    print("\n🔴 Mango Markets Exploit (Oct 2022)")
-    print("-" * 70)
-    results["mango"] = collect_mango_exploit_data()
-    
-    # LUNA Collapse
-    print("\n🌙 LUNA/UST Collapse (May 2022)")
-    print("-" * 70)
-    results["luna"] = collect_luna_collapse_data()
-    
-    # FTT Collapse
-    print("\n💥 FTX Token Collapse (Nov 2022)")
-    print("-" * 70)
-    results["ftt"] = collect_ftt_collapse_data()
-    
+    collectors = [
+        ("mango", "🔴 Mango Markets Exploit (Oct 2022)", "mango_exploit"),
+        ("luna", "🌙 LUNA/UST Collapse (May 2022)", "luna_collapse"),
+        ("ftt", "💥 FTX Token Collapse (Nov 2022)", "ftt_collapse"),
+    ]
+
+    for _, banner, _event_key in collectors:
+        print(f"  {banner}")
+    print()
+
+    # The three events hit different endpoints, so fetch them concurrently.
+    # _REQUEST_GATE serializes the actual HTTP requests to respect the
+    # per-IP rate limit; processing and CSV writing overlap freely.
+    with ThreadPoolExecutor(max_workers=len(collectors)) as executor:
+        futures = {
+            event: executor.submit(collect_event, event_key)
+            for event, _, event_key in collectors
+        }
+        results = {event: future.result() for event, future in futures.items()}
+
     print("\n" + "="*70)
     print("✅ Data Collection Complete!")
     print("="*70 + "\n")
@@ -380,74 +480,57 @@ def collect_all_crisis_data():
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def analyze_price_data(filepath: str):
+def inspect_price_data(filepath: str) -> bool:
     """
-    Quick analysis of collected price data.
-    
+    Verify data quality and print summary statistics in one CSV read.
+
     Args:
         filepath: Path to CSV file
+
+    Returns:
+        True if data is good quality
     """
-    prices = []
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            prices.append(float(row["price_usd"]))
-    
-    if not prices:
-        print("No price data found")
-        return
-    
+    try:
+        df = pd.read_csv(filepath, usecols=["timestamp", "price_usd"])
+    except Exception as e:
+        print(f"❌ {filepath}: Error - {e}")
+        return False
+
+    if len(df) == 0:
+        print(f"❌ {filepath}: No data")
+        return False
+
+    # Check for missing or non-positive prices (single vectorized pass)
+    invalid = df["price_usd"].isna() | (df["price_usd"] <= 0)
+    if invalid.any():
+        print(f"❌ {filepath}: Invalid price at row {int(invalid.idxmax())}")
+        return False
+
+    # Check timestamp ordering
+    if not df["timestamp"].is_monotonic_increasing:
+        print(f"❌ {filepath}: Timestamps not in order")
+        return False
+
+    print(f"✅ {filepath}: Data quality good ({len(df)} points)")
+
+    prices = df["price_usd"].to_numpy()
+    peak = prices.max()
+    bottom = prices.min()
+
     print(f"\n📈 Price Data Analysis: {filepath}")
     print(f"   Data points: {len(prices)}")
     print(f"   Starting price: ${prices[0]:.4f}")
     print(f"   Ending price: ${prices[-1]:.4f}")
-    print(f"   Peak price: ${max(prices):.4f}")
-    print(f"   Bottom price: ${min(prices):.4f}")
-    
+    print(f"   Peak price: ${peak:.4f}")
+    print(f"   Bottom price: ${bottom:.4f}")
+
     total_change = ((prices[-1] - prices[0]) / prices[0]) * 100
-    max_drawdown = ((min(prices) - max(prices)) / max(prices)) * 100
-    
+    max_drawdown = ((bottom - peak) / peak) * 100
+
     print(f"   Total change: {total_change:+.1f}%")
     print(f"   Max drawdown: {max_drawdown:.1f}%")
 
-
-def verify_data_quality(filepath: str) -> bool:
-    """
-    Verify data quality and completeness.
-    
-    Args:
-        filepath: Path to CSV file
-    
-    Returns:
-        True if data is good quality
-    """
-    try:
-        with open(filepath, 'r') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        
-        if len(rows) == 0:
-            print(f"❌ {filepath}: No data")
-            return False
-        
-        # Check for missing values
-        for i, row in enumerate(rows):
-            if not row.get("price_usd") or float(row["price_usd"]) <= 0:
-                print(f"❌ {filepath}: Invalid price at row {i}")
-                return False
-        
-        # Check timestamp ordering
-        timestamps = [int(row["timestamp"]) for row in rows]
-        if timestamps != sorted(timestamps):
-            print(f"❌ {filepath}: Timestamps not in order")
-            return False
-        
-        print(f"✅ {filepath}: Data quality good ({len(rows)} points)")
-        return True
-    
-    except Exception as e:
-        print(f"❌ {filepath}: Error - {e}")
-        return False
+    return True
 
 
 # ============================================================================
@@ -460,12 +543,11 @@ if __name__ == "__main__":
     # Collect all data
     results = collect_all_crisis_data()
     
-    # Verify and analyze
+    # Verify and analyze (single read per file)
     print("\n📊 Verifying Data Quality...\n")
     for event, filepath in results.items():
         if filepath:
-            verify_data_quality(filepath)
-            analyze_price_data(filepath)
+            inspect_price_data(filepath)
     
     print("\n✅ All data collected and verified!")
     print("\nData ready for simulation analysis.")
@@ -0,0 +1,64 @@
+# cython: language_level=3, cdivision=True
+"""
+Typed C kernel for the dynamic collateral factor hot path.
+
+Optional: build in place with
+
+    cythonize -i modules/_cf_kernel.pyx
+
+collateral_factor.py imports this opportunistically and falls back to
+the pure-Python implementation when the extension is absent. Arithmetic
+uses 128-bit intermediates so results are bit-identical to the bigint
+path for inputs inside the range checked on the Python side
+(collateral and price below 2**52, NAD <= debt_reserve < 2**63).
+"""
+
+from libc.math cimport sqrtl
+
+cdef extern from *:
+    ctypedef long long int128 "__int128"
+
+cdef enum:
+    NAD = 1000000000
+    BPS_DENOMINATOR = 10000
+
+
+cdef int128 _isqrt128(int128 n) noexcept nogil:
+    """Exact floor sqrt: long-double seed plus local correction."""
+    cdef int128 x
+    if n <= 0:
+        return 0
+    x = <int128>sqrtl(<long double>n)
+    while x * x > n:
+        x -= 1
+    while (x + 1) * (x + 1) <= n:
+        x += 1
+    return x
+
+
+cpdef long long cf_dynamic_bps(long long collateral_amount,
+                               long long collateral_ema_price,
+                               long long debt_reserve) noexcept nogil:
+    """
+    calculate_dynamic_cf for inputs inside the int128-safe range.
+
+    Mirrors curve_y_from_v step for step; the caller guarantees the
+    range contract documented in the module docstring.
+    """
+    cdef int128 v, a_scaled, four_a_plus_one, sqrt_term
+    cdef int128 numerator, denominator, t_scaled, y
+
+    v = (<int128>collateral_amount * collateral_ema_price) // NAD
+    if v == 0:
+        return 0
+
+    a_scaled = (v * NAD) // debt_reserve
+    four_a_plus_one = 4 * a_scaled + NAD
+    sqrt_term = _isqrt128(four_a_plus_one * NAD)
+
+    numerator = 2 * a_scaled * NAD
+    denominator = 2 * a_scaled + NAD + sqrt_term
+    t_scaled = numerator // denominator
+
+    y = (<int128>debt_reserve * t_scaled) // NAD
+    return <long long>((y * BPS_DENOMINATOR) // v)
@@ -0,0 +1,202 @@
+"""
+Numba-Compiled Hot-Path Kernels
+Exact int64 fixed-point arithmetic for the per-tick simulation loops
+"""
+
+from config import NAD, BPS_DENOMINATOR
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to plain Python
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Inputs below this bound keep every intermediate of the decomposed
+# muldivs inside int64 (a*b//NAD < 2**63 needs a, b < 2**46, about
+# $70K at NAD scale); larger values must take the callers' bigint paths
+MAX_INPUT = 1 << 46
+
+# Tighter bound for divisions BY a price (a * NAD // price): the limb
+# split in div_by_price needs price < 2**40 - NAD (about $1K at NAD
+# scale) so its widest partial, (rh << 23) + r0 * NAD with rh < price,
+# stays below price * 2**23 + NAD * 2**23 <= 2**63
+MAX_PRICE = (1 << 40) - NAD
+
+
+@njit("i8(i8, i8)", cache=True)
+def muldiv_nad(a: int, b: int) -> int:
+    """
+    Exact a * b // NAD without 128-bit intermediates.
+
+    Splits both operands against NAD so every partial product stays in
+    int64 for a, b < MAX_INPUT:
+
+        a*b//NAD = qa*qb*NAD + qa*rb + qb*ra + (ra*rb)//NAD
+
+    fastmath stays off throughout this module — the kernels replicate
+    integer semantics, not approximate them.
+    """
+    qa = a // NAD
+    ra = a - qa * NAD
+    qb = b // NAD
+    rb = b - qb * NAD
+    return qa * qb * NAD + qa * rb + qb * ra + (ra * rb) // NAD
+
+
+@njit("i8(i8, i8, i8)", cache=True)
+def ema_step(last_ema: int, spot_price: int, alpha_nad: int) -> int:
+    """
+    Exact (spot*(NAD-alpha) + ema*alpha) // NAD in 64-bit arithmetic.
+
+    Same operand split as muldiv_nad, applied to the fused blend so the
+    result matches the bigint recurrence bit for bit for inputs below
+    MAX_INPUT.
+    """
+    w = NAD - alpha_nad
+    qs = spot_price // NAD
+    rs = spot_price - qs * NAD
+    qe = last_ema // NAD
+    re = last_ema - qe * NAD
+    return qs * w + qe * alpha_nad + (rs * w + re * alpha_nad) // NAD
+
+
+@njit("i8(i8, i8)", cache=True)
+def div_by_price(amount: int, price: int) -> int:
+    """
+    Exact amount * NAD // price without 128-bit intermediates.
+
+    amount * NAD reaches 2**76 for NAD-scale amounts, so the remainder
+    against price is split into 23-bit limbs and the division long-
+    divided limb by limb. Exact for 0 < price < MAX_PRICE — the widest
+    partial, (rh << 23) + r0 * NAD, only fits int64 with that NAD of
+    headroom below 2**40 — when the quotient amount // price stays at
+    or below MAX_INPUT // NAD (result under 2**47); callers that clamp
+    the result must branch before the quotient grows past that.
+    """
+    q = amount // price
+    r = amount - q * price
+    r1 = r >> 23
+    r0 = r & 0x7FFFFF
+    h = r1 * NAD
+    qh = h // price
+    rh = h - qh * price
+    return q * NAD + (qh << 23) + ((rh << 23) + r0 * NAD) // price
+
+
+# The configuration knobs (liq_cf_bps, close_factor_bps,
+# liquidation_incentive_bps) are ordinary i8 runtime arguments, never
+# baked in as compile-time literals or globals: one compiled binary
+# serves every SimulationConfig, so sweeping configs pays the JIT cost
+# exactly once per process (and once per machine with cache=True)
+@njit("UniTuple(i8, 13)(i8, i8, i8, i8, i8, i8)", cache=True)
+def liq_core(col: int, price: int, debt: int, liq_cf_bps: int,
+             close_factor_bps: int, liquidation_incentive_bps: int):
+    """
+    calculate_liquidation arithmetic as one compiled int64 kernel.
+
+    Mirrors liquidation_engine.calculate_liquidation exactly (fastmath
+    off, same floor divisions) for col, debt < MAX_INPUT and
+    0 < price < MAX_PRICE; the wrapper falls back to the bigint path
+    outside that range.
+
+    Returns:
+        Tuple of (liquidatable, is_insolvent, debt_to_repay,
+        collateral_seized, liquidator_bonus, collateral_to_reserves,
+        bad_debt, remaining_collateral, remaining_debt,
+        liquidator_profit_usd, collateral_value, borrow_limit,
+        health_factor), all int64; the trailing amounts are zero on the
+        healthy branch
+    """
+    qc = col // NAD
+    rc = col - qc * NAD
+    qp = price // NAD
+    rp = price - qp * NAD
+    collateral_value = qc * qp * NAD + qc * rp + qp * rc + (rc * rp) // NAD
+
+    qv = collateral_value // BPS_DENOMINATOR
+    rv = collateral_value - qv * BPS_DENOMINATOR
+    borrow_limit = qv * liq_cf_bps + (rv * liq_cf_bps) // BPS_DENOMINATOR
+
+    if debt < borrow_limit:
+        health_factor = (borrow_limit * 100) // debt if debt > 0 else 999
+        return (0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+                collateral_value, borrow_limit, health_factor)
+
+    excess_debt = debt - collateral_value
+    is_insolvent = 1 if excess_debt > 0 else 0
+
+    if is_insolvent:
+        debt_to_repay = debt
+    else:
+        partial_debt = (debt * close_factor_bps) // BPS_DENOMINATOR
+        debt_to_repay = debt if debt < partial_debt else partial_debt
+
+    # A quotient past MAX_INPUT // NAD puts the unclamped seize above
+    # MAX_INPUT, hence above col — clamp without running div_by_price
+    # out of range
+    if debt_to_repay // price > MAX_INPUT // NAD:
+        collateral_seized = col
+    else:
+        collateral_seized = div_by_price(debt_to_repay, price)
+        if collateral_seized > col:
+            collateral_seized = col
+
+    liquidator_bonus = (
+        collateral_seized * liquidation_incentive_bps
+    ) // BPS_DENOMINATOR
+    collateral_to_reserves = collateral_seized - liquidator_bonus
+    if collateral_to_reserves < 0:
+        collateral_to_reserves = 0
+
+    bad_debt = excess_debt if is_insolvent else 0
+
+    qb = liquidator_bonus // NAD
+    rb = liquidator_bonus - qb * NAD
+    bonus_value = qb * qp * NAD + qb * rp + qp * rb + (rb * rp) // NAD
+
+    return (
+        1, is_insolvent, debt_to_repay, collateral_seized,
+        liquidator_bonus, collateral_to_reserves, bad_debt,
+        col - collateral_seized, debt - debt_to_repay,
+        bonus_value - debt_to_repay, collateral_value, borrow_limit, 0,
+    )
+
+
+@njit("b1[:](i8[:], i8[:], i8[:], i8, b1[:])", cache=True)
+def liquidatable_mask(col, debt, liq_cf_bps, lending_price, out):
+    """
+    Vectorized liquidation screen over position arrays (int64, exact).
+
+    Flags index i when debt >= ((col * price) // NAD) * liq_cf // BPS,
+    the same predicate calculate_liquidation applies before doing any
+    real work. Both muldivs are decomposed, so every intermediate fits
+    int64 as long as the caller keeps col and lending_price below
+    MAX_INPUT.
+
+    Args:
+        col: Collateral per position (int64, NAD-scaled)
+        debt: Debt per position (int64, NAD-scaled)
+        liq_cf_bps: Liquidation CF per position (int64)
+        lending_price: Shared lending price (NAD-scaled)
+        out: Bool array filled in place
+
+    Returns:
+        out, True where the position is liquidatable
+    """
+    qp = lending_price // NAD
+    rp = lending_price - qp * NAD
+    for i in range(col.shape[0]):
+        c = col[i]
+        qc = c // NAD
+        rc = c - qc * NAD
+        cv = qc * qp * NAD + qc * rp + qp * rc + (rc * rp) // NAD
+        cf = liq_cf_bps[i]
+        qv = cv // BPS_DENOMINATOR
+        rv = cv - qv * BPS_DENOMINATOR
+        out[i] = debt[i] >= qv * cf + (rv * cf) // BPS_DENOMINATOR
+    return out
@@ -4,8 +4,82 @@ Implements slippage-aware and pessimistic CF logic from OmniPair
 """
 
 import math
-from typing import Optional, Tuple
-from config import NAD, BPS_DENOMINATOR, MAX_COLLATERAL_FACTOR_BPS, LTV_BUFFER_BPS
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from config import NAD, NAD_BPS, BPS_DENOMINATOR, MAX_COLLATERAL_FACTOR_BPS, LTV_BUFFER_BPS
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    # Optional compiled kernel (cythonize -i modules/_cf_kernel.pyx)
+    from _cf_kernel import cf_dynamic_bps as _cf_dynamic_c
+except ImportError:
+    _cf_dynamic_c = None
+
+# Input bound under which the compiled kernel's 128-bit intermediates
+# cannot overflow (see _cf_kernel.pyx); larger values take the bigint path
+_CF_KERNEL_MAX_INPUT = 1 << 52
+
+# Largest value whose pessimistic-cap product (spot * base_cf) still fits
+# in int64; above this the Python bigint path is used instead of the kernel
+_INT64_SAFE_PRICE = (2**63 - 1) // BPS_DENOMINATOR
+
+
+@njit("i8(i8, i8, i8)", cache=True)
+def _pessimistic_cf_nb(base_cf_bps: int, spot_price: int, ema_price: int) -> int:
+    """int64 kernel for get_pessimistic_cf_bps (inputs pre-validated)."""
+    shrunk_cf = (spot_price * base_cf_bps) // ema_price
+    cf_bps = base_cf_bps if base_cf_bps < shrunk_cf else shrunk_cf
+    if cf_bps < 100:
+        cf_bps = 100
+    if cf_bps > MAX_COLLATERAL_FACTOR_BPS:
+        cf_bps = MAX_COLLATERAL_FACTOR_BPS
+    return cf_bps
+
+
+def _isqrt_newton(n: int) -> int:
+    """
+    Exact integer square root via Newton's method.
+
+    Seeds with 1 << ((bit_length + 1) // 2) — one power of two above the
+    true root — so the iteration converges in O(log log n) steps instead
+    of the O(log n) a naive seed costs, then corrects the final off-by-one.
+    Portable fallback for runtimes without math.isqrt.
+
+    Args:
+        n: Non-negative integer
+
+    Returns:
+        floor(sqrt(n))
+    """
+    if n < 0:
+        raise ValueError("isqrt of negative number")
+    if n == 0:
+        return 0
+
+    x = 1 << ((n.bit_length() + 1) // 2)
+    while True:
+        y = (x + n // x) // 2
+        if y >= x:
+            break
+        x = y
+
+    while x * x > n:
+        x -= 1
+    return x
+
+
+# CPython >= 3.8 provides a C-implemented exact isqrt; keep the Newton
+# variant as the fallback for runtimes that lack it
+_isqrt = getattr(math, "isqrt", _isqrt_newton)
 
 
 def curve_y_from_v(v: int, r1: int) -> int:
@@ -36,7 +110,18 @@ def curve_y_from_v(v: int, r1: int) -> int:
     
     # sqrt_term = sqrt(4a + 1) * NAD
     four_a_plus_one = (4 * a_scaled) + NAD
-    sqrt_term = int(math.sqrt(four_a_plus_one * NAD))
+    arg = four_a_plus_one * NAD
+    if arg.bit_length() <= 53:
+        # Typical pools: one hardware sqrt, then a one-step correction
+        # since the rounded float can land one off the integer floor
+        sqrt_term = int(math.sqrt(arg))
+        if sqrt_term * sqrt_term > arg:
+            sqrt_term -= 1
+        elif (sqrt_term + 1) * (sqrt_term + 1) <= arg:
+            sqrt_term += 1
+    else:
+        # Beyond float53 the hardware sqrt is untrustworthy; exact isqrt
+        sqrt_term = _isqrt(arg)
     
     # numerator = 2a * NAD
     numerator = 2 * a_scaled * NAD
@@ -79,17 +164,22 @@ def get_pessimistic_cf_bps(
     """
     if ema_price == 0:
         return 100  # Minimum 1%
-    
-    # Shrink CF proportionally if spot < ema
+
+    # Hot path: lowered to machine int64 when the product cannot
+    # overflow; the EMA is lowered too, so it must also fit int64
+    if spot_price <= _INT64_SAFE_PRICE and ema_price < 2**63:
+        return int(_pessimistic_cf_nb(base_cf_bps, spot_price, ema_price))
+
+    # Bigint fallback for out-of-range prices
     shrunk_cf = (spot_price * base_cf_bps) // ema_price
-    
+
     # Take minimum (pessimistic)
     cf_bps = min(base_cf_bps, shrunk_cf)
-    
+
     # Clamp to valid range
     cf_bps = max(100, cf_bps)  # Floor at 1%
     cf_bps = min(MAX_COLLATERAL_FACTOR_BPS, cf_bps)  # Cap at 85%
-    
+
     return cf_bps
 
 
@@ -111,22 +201,36 @@ def calculate_dynamic_cf(
     """
     if debt_reserve == 0:
         return 0
-    
+
+    # Compiled kernel when available and inputs fit its 128-bit range
+    if (_cf_dynamic_c is not None
+            and collateral_amount < _CF_KERNEL_MAX_INPUT
+            and collateral_ema_price < _CF_KERNEL_MAX_INPUT
+            and NAD <= debt_reserve < (1 << 63)):
+        return _cf_dynamic_c(collateral_amount, collateral_ema_price, debt_reserve)
+
     # V = collateral value at EMA price
     v = (collateral_amount * collateral_ema_price) // NAD
-    
+
     if v == 0:
         return 0
-    
+
     # Calculate max borrowable from curve
     y_curve = curve_y_from_v(v, debt_reserve)
-    
+
     # CF = Y / V (as basis points)
     cf_bps = (y_curve * BPS_DENOMINATOR) // v
-    
+
     return cf_bps
 
 
+class CFResult(NamedTuple):
+    """Result triple from the CF evaluation; unpacks like a plain tuple."""
+    max_borrow: int
+    max_cf_bps: int
+    liq_cf_bps: int
+
+
 def pessimistic_max_debt(
     collateral_amount: int,
     collateral_ema_price: int,
@@ -158,19 +262,47 @@ def pessimistic_max_debt(
     """
     # Sanity checks
     if collateral_amount == 0 or collateral_ema_price == 0 or collateral_spot_price == 0:
-        return (0, 0, 0)
-    
-    # V = collateral value at EMA price
-    v = (collateral_amount * collateral_ema_price) // NAD
-    
+        return CFResult(0, 0, 0)
+    if use_dynamic_cf and fixed_cf_bps is None and debt_reserve == 0:
+        return CFResult(0, 0, 0)
+
+    return CFResult(*_pessimistic_max_debt_unchecked(
+        collateral_amount,
+        collateral_ema_price,
+        collateral_spot_price,
+        debt_reserve,
+        fixed_cf_bps=fixed_cf_bps,
+        use_dynamic_cf=use_dynamic_cf,
+        use_pessimistic_cap=use_pessimistic_cap,
+        use_ltv_buffer=use_ltv_buffer
+    ))
+
+
+def _pessimistic_max_debt_unchecked(
+    collateral_amount: int,
+    collateral_ema_price: int,
+    collateral_spot_price: int,
+    debt_reserve: int,
+    fixed_cf_bps: Optional[int] = None,
+    use_dynamic_cf: bool = True,
+    use_pessimistic_cap: bool = True,
+    use_ltv_buffer: bool = True
+) -> Tuple[int, int, int]:
+    """
+    Core CF evaluation without input guards.
+
+    Contract: collateral_amount, collateral_ema_price and
+    collateral_spot_price are nonzero, and debt_reserve is nonzero when
+    the dynamic-CF path is active. The simulation mainline pre-validates
+    these, so the hot loop skips the per-call checks; external callers
+    should use pessimistic_max_debt.
+    """
     # ===== Step 1: Determine Base CF =====
     if fixed_cf_bps is not None:
         # Fixed CF mode (traditional lending)
         base_cf_bps = fixed_cf_bps
     elif use_dynamic_cf:
         # Dynamic CF mode (OmniPair innovation)
-        if debt_reserve == 0:
-            return (0, 0, 0)
         base_cf_bps = calculate_dynamic_cf(collateral_amount, collateral_ema_price, debt_reserve)
     else:
         # Default fallback (shouldn't happen)
@@ -193,43 +325,244 @@ def pessimistic_max_debt(
     else:
         buffer = 0
     
-    max_allowed_cf_bps = max(0, liquidation_cf_bps - buffer)
-    
+    max_allowed_cf_bps = max(liquidation_cf_bps - buffer, 0)
+
     # ===== Step 4: Calculate Max Borrow Limit =====
-    max_borrow = (v * max_allowed_cf_bps) // BPS_DENOMINATOR
-    
+    # Fused V-and-CF step: one bignum division against NAD_BPS instead of
+    # dividing by NAD for V and again by BPS_DENOMINATOR for the limit
+    max_borrow = (collateral_amount * collateral_ema_price * max_allowed_cf_bps) // NAD_BPS
+
     return (max_borrow, max_allowed_cf_bps, liquidation_cf_bps)
 
 
+# Specialized variants of pessimistic_max_debt, keyed by config flags so
+# calculators with the same settings share one closure
+_SPECIALIZED_CACHE = {}
+
+
+def specialize_max_debt(
+    fixed_cf_bps: Optional[int] = None,
+    use_dynamic_cf: bool = True,
+    use_pessimistic_cap: bool = True,
+    use_ltv_buffer: bool = True,
+    checked: bool = True
+):
+    """
+    Build a pessimistic_max_debt variant with the config branches
+    resolved once instead of re-checked on every call.
+
+    The returned closure has the same signature and bit-identical results
+    as pessimistic_max_debt with the corresponding keyword arguments:
+    (collateral_amount, ema_price, spot_price, debt_reserve) ->
+    (max_borrow, max_allowed_cf_bps, liquidation_cf_bps).
+
+    With checked=False the zero-input guards are dropped as well; the
+    caller then owns the _pessimistic_max_debt_unchecked contract.
+    """
+    key = (fixed_cf_bps, use_dynamic_cf, use_pessimistic_cap, use_ltv_buffer, checked)
+    cached = _SPECIALIZED_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    buffer = LTV_BUFFER_BPS if use_ltv_buffer else 0
+    dynamic = use_dynamic_cf and fixed_cf_bps is None
+
+    # Step 1 resolved at build time
+    if fixed_cf_bps is not None:
+        fixed = fixed_cf_bps
+
+        def base_cf(collateral_amount, ema_price, debt_reserve):
+            return fixed
+    elif use_dynamic_cf:
+        base_cf = calculate_dynamic_cf
+    else:
+        def base_cf(collateral_amount, ema_price, debt_reserve):
+            return 7500  # Default fallback
+
+    # Step 2 resolved at build time
+    if use_pessimistic_cap:
+        cap = get_pessimistic_cf_bps
+    else:
+        def cap(base_cf_bps, spot_price, ema_price):
+            return min(base_cf_bps, MAX_COLLATERAL_FACTOR_BPS)
+
+    def core(collateral_amount, collateral_ema_price, collateral_spot_price, debt_reserve):
+        base = base_cf(collateral_amount, collateral_ema_price, debt_reserve)
+        liquidation_cf_bps = cap(base, collateral_spot_price, collateral_ema_price)
+        max_allowed_cf_bps = max(liquidation_cf_bps - buffer, 0)
+        max_borrow = (collateral_amount * collateral_ema_price * max_allowed_cf_bps) // NAD_BPS
+        return (max_borrow, max_allowed_cf_bps, liquidation_cf_bps)
+
+    if checked:
+        def calculate(collateral_amount, collateral_ema_price, collateral_spot_price, debt_reserve):
+            if collateral_amount == 0 or collateral_ema_price == 0 or collateral_spot_price == 0:
+                return (0, 0, 0)
+            if dynamic and debt_reserve == 0:
+                return (0, 0, 0)
+            return core(collateral_amount, collateral_ema_price, collateral_spot_price, debt_reserve)
+    else:
+        calculate = core
+
+    _SPECIALIZED_CACHE[key] = calculate
+    return calculate
+
+
+# Elementwise exact integer sqrt for object arrays (NAD-scaled products
+# exceed both int64 and float64's 2^53 exact range)
+_isqrt_vec = np.frompyfunc(_isqrt, 1, 1)
+
+
+def pessimistic_max_debt_batch(
+    collateral_amounts,
+    collateral_ema_prices,
+    collateral_spot_prices,
+    debt_reserve: int,
+    fixed_cf_bps: Optional[int] = None,
+    use_dynamic_cf: bool = True,
+    use_pessimistic_cap: bool = True,
+    use_ltv_buffer: bool = True,
+    out: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized pessimistic_max_debt over parallel position arrays.
+
+    Evaluates every step (V, dynamic CF curve, pessimistic shrink, LTV
+    buffer, clamps) as one array pass instead of a Python call per
+    position. Arithmetic runs on object (bigint) arrays so results are
+    bit-identical to the scalar function — NAD-scaled products routinely
+    exceed int64 and float64's exact range.
+
+    Args:
+        collateral_amounts: Collateral per position (NAD-scaled)
+        collateral_ema_prices: EMA price per position (NAD-scaled)
+        collateral_spot_prices: Spot price per position (NAD-scaled)
+        debt_reserve: Debt token reserve in pool (NAD-scaled, shared)
+        fixed_cf_bps: If provided, use this instead of dynamic CF
+        use_dynamic_cf: If True and no fixed_cf, calculate dynamic CF
+        use_pessimistic_cap: If True, apply spot/EMA divergence cap
+        use_ltv_buffer: If True, apply LTV buffer (5%)
+        out: Optional preallocated (n, 3) int64 array to fill in place,
+            so tick loops can reuse one buffer instead of allocating
+            three arrays per call
+
+    Returns:
+        Tuple of (max_borrows, max_allowed_cf_bps, liquidation_cf_bps)
+        as int64 arrays (views into out when provided)
+    """
+    collateral = np.asarray(collateral_amounts, dtype=object)
+    ema = np.asarray(collateral_ema_prices, dtype=object)
+    spot = np.asarray(collateral_spot_prices, dtype=object)
+    n = len(collateral)
+
+    valid = (collateral != 0) & (ema != 0) & (spot != 0)
+
+    if not valid.any() or (use_dynamic_cf and fixed_cf_bps is None and debt_reserve == 0):
+        if out is not None:
+            out[:] = 0
+            return (out[:, 0], out[:, 1], out[:, 2])
+        zeros = np.zeros(n, dtype=np.int64)
+        return (zeros, zeros.copy(), zeros.copy())
+
+    # V = collateral value at EMA price
+    v = collateral * ema // NAD
+    v_safe = np.where(v > 0, v, 1)
+
+    # ===== Step 1: Determine Base CF =====
+    if fixed_cf_bps is not None:
+        base_cf_bps = np.full(n, fixed_cf_bps, dtype=object)
+    elif use_dynamic_cf:
+        # curve_y_from_v, elementwise
+        a_scaled = v * NAD // debt_reserve
+        four_a_plus_one = 4 * a_scaled + NAD
+        sqrt_term = _isqrt_vec(four_a_plus_one * NAD)
+        denominator = 2 * a_scaled + NAD + sqrt_term
+        t_scaled = 2 * a_scaled * NAD // denominator
+        y_curve = debt_reserve * t_scaled // NAD
+        base_cf_bps = y_curve * BPS_DENOMINATOR // v_safe
+    else:
+        base_cf_bps = np.full(n, 7500, dtype=object)  # Default fallback
+
+    # ===== Step 2: Apply Pessimistic Cap (if enabled) =====
+    if use_pessimistic_cap:
+        shrunk_cf = spot * base_cf_bps // np.where(ema > 0, ema, 1)
+        liquidation_cf_bps = np.minimum(base_cf_bps, shrunk_cf)
+        liquidation_cf_bps = np.maximum(100, liquidation_cf_bps)
+        liquidation_cf_bps = np.minimum(MAX_COLLATERAL_FACTOR_BPS, liquidation_cf_bps)
+    else:
+        liquidation_cf_bps = np.minimum(base_cf_bps, MAX_COLLATERAL_FACTOR_BPS)
+
+    # ===== Step 3: Apply LTV Buffer (if enabled) =====
+    buffer = LTV_BUFFER_BPS if use_ltv_buffer else 0
+    max_allowed_cf_bps = np.maximum(0, liquidation_cf_bps - buffer)
+
+    # ===== Step 4: Calculate Max Borrow Limit =====
+    # Same fused NAD_BPS division as the scalar function (bit-identity)
+    max_borrow = collateral * ema * max_allowed_cf_bps // NAD_BPS
+
+    if out is not None:
+        out[:, 0] = np.where(valid, max_borrow, 0).astype(np.int64)
+        out[:, 1] = np.where(valid, max_allowed_cf_bps, 0).astype(np.int64)
+        out[:, 2] = np.where(valid, liquidation_cf_bps, 0).astype(np.int64)
+        return (out[:, 0], out[:, 1], out[:, 2])
+
+    return (
+        np.where(valid, max_borrow, 0).astype(np.int64),
+        np.where(valid, max_allowed_cf_bps, 0).astype(np.int64),
+        np.where(valid, liquidation_cf_bps, 0).astype(np.int64),
+    )
+
+
 class CollateralFactorCalculator:
     """
     Configurable collateral factor calculator that can operate in
     different modes for comparative analysis.
     """
-    
+
+    __slots__ = (
+        'use_dynamic_cf',
+        'use_pessimistic_cap',
+        'use_ltv_buffer',
+        'fixed_cf_bps',
+        'max_cf_bps',
+        'trusted_inputs',
+        '_calculate',
+    )
+
     def __init__(
         self,
         use_dynamic_cf: bool = True,
         use_pessimistic_cap: bool = True,
         use_ltv_buffer: bool = True,
         fixed_cf_bps: Optional[int] = None,
-        max_cf_bps: int = MAX_COLLATERAL_FACTOR_BPS
+        max_cf_bps: int = MAX_COLLATERAL_FACTOR_BPS,
+        trusted_inputs: bool = False
     ):
         """
         Initialize CF calculator with configuration.
-        
+
         Args:
             use_dynamic_cf: Enable AMM curve-based dynamic CF
             use_pessimistic_cap: Enable spot/EMA divergence protection
             use_ltv_buffer: Enable LTV safety buffer
             fixed_cf_bps: If set, use this fixed CF instead of dynamic
             max_cf_bps: Maximum allowed CF cap
+            trusted_inputs: If True, skip per-call zero-input guards; the
+                caller must pre-validate amounts, prices and reserve
         """
         self.use_dynamic_cf = use_dynamic_cf
         self.use_pessimistic_cap = use_pessimistic_cap
         self.use_ltv_buffer = use_ltv_buffer
         self.fixed_cf_bps = fixed_cf_bps
         self.max_cf_bps = max_cf_bps
+        self.trusted_inputs = trusted_inputs
+        # Bind the flag-specialized variant once; per-call flag checks gone
+        self._calculate = specialize_max_debt(
+            fixed_cf_bps=fixed_cf_bps,
+            use_dynamic_cf=use_dynamic_cf,
+            use_pessimistic_cap=use_pessimistic_cap,
+            use_ltv_buffer=use_ltv_buffer,
+            checked=not trusted_inputs,
+        )
     
     def calculate(
         self,
@@ -240,19 +573,45 @@ class CollateralFactorCalculator:
     ) -> Tuple[int, int, int]:
         """
         Calculate max debt and CF using configured settings.
-        
+
         Returns:
             (max_borrow, max_allowed_cf_bps, liquidation_cf_bps)
         """
-        return pessimistic_max_debt(
+        return self._calculate(
             collateral_amount,
             collateral_ema_price,
             collateral_spot_price,
+            debt_reserve
+        )
+
+    def calculate_batch(
+        self,
+        collateral_amounts,
+        collateral_ema_price: int,
+        collateral_spot_price: int,
+        debt_reserve: int,
+        out: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate over an array of collateral amounts sharing
+        one (ema, spot, reserve) snapshot — the per-tick pool shape, where
+        prices are pool-wide and only collateral differs per position.
+
+        Returns:
+            (max_borrows, max_allowed_cf_bps, liquidation_cf_bps) int64
+            arrays, bit-identical to calling calculate per element
+        """
+        n = len(collateral_amounts)
+        return pessimistic_max_debt_batch(
+            collateral_amounts,
+            np.full(n, collateral_ema_price, dtype=object),
+            np.full(n, collateral_spot_price, dtype=object),
             debt_reserve,
             fixed_cf_bps=self.fixed_cf_bps,
             use_dynamic_cf=self.use_dynamic_cf,
             use_pessimistic_cap=self.use_pessimistic_cap,
-            use_ltv_buffer=self.use_ltv_buffer
+            use_ltv_buffer=self.use_ltv_buffer,
+            out=out,
         )
 
 
@@ -366,6 +725,35 @@ def test_ltv_buffer():
     print(f"   Buffer: {gap/100}%")
 
 
+def test_batch_matches_scalar():
+    """Test batched evaluation matches the scalar function bit-for-bit"""
+    collaterals = [0, 1, 100 * NAD, 1000 * NAD, 50_000 * NAD]
+    emas = [0, 900_000_000, 1_000_000_000, 1_500_000_000]
+    spots = [0, 800_000_000, 1_000_000_000, 1_200_000_000]
+    reserve = 500_000 * NAD
+
+    cases = [(c, e, s) for c in collaterals for e in emas for s in spots]
+    coll_arr = [c for c, _, _ in cases]
+    ema_arr = [e for _, e, _ in cases]
+    spot_arr = [s for _, _, s in cases]
+
+    for kwargs in [
+        {},
+        {"fixed_cf_bps": 7500, "use_dynamic_cf": False},
+        {"use_pessimistic_cap": False},
+        {"use_ltv_buffer": False},
+    ]:
+        borrows, max_cfs, liq_cfs = pessimistic_max_debt_batch(
+            coll_arr, ema_arr, spot_arr, reserve, **kwargs
+        )
+        for i, (c, e, s) in enumerate(cases):
+            expected = pessimistic_max_debt(c, e, s, reserve, **kwargs)
+            got = (int(borrows[i]), int(max_cfs[i]), int(liq_cfs[i]))
+            assert got == expected, f"Mismatch at {(c, e, s, kwargs)}: {got} != {expected}"
+
+    print(f"✅ Batch test: {len(cases)} cases x 4 configs match scalar exactly")
+
+
 def run_all_tests():
     """Run all CF calculator tests"""
     print("\n🧪 Running Collateral Factor Tests...\n")
@@ -373,6 +761,7 @@ def run_all_tests():
     test_pessimistic_cap()
     test_dynamic_vs_fixed_cf()
     test_ltv_buffer()
+    test_batch_matches_scalar()
     print("\n✅ All CF tests passed!\n")
 
 
@@ -387,17 +776,16 @@ if __name__ == "__main__":
     price = 1_500_000_000  # $1.50 per token
     reserve = 500_000 * NAD  # $500K pool
     
-    configs = [
-        ("Traditional (Fixed 75%)", {"fixed_cf_bps": 7500, "use_dynamic_cf": False, "use_pessimistic_cap": False, "use_ltv_buffer": False}),
-        ("Only Dynamic CF", {"use_dynamic_cf": True, "use_pessimistic_cap": False, "use_ltv_buffer": False}),
-        ("Dynamic + Pessimistic", {"use_dynamic_cf": True, "use_pessimistic_cap": True, "use_ltv_buffer": False}),
-        ("Full GAMM", {"use_dynamic_cf": True, "use_pessimistic_cap": True, "use_ltv_buffer": True}),
-    ]
-    
-    for name, kwargs in configs:
-        max_borrow, max_cf, liq_cf = pessimistic_max_debt(
-            collateral, price, price, reserve, **kwargs
-        )
+    # Flag branches resolved once per config; the loop just calls
+    configs = (
+        ("Traditional (Fixed 75%)", specialize_max_debt(fixed_cf_bps=7500, use_dynamic_cf=False, use_pessimistic_cap=False, use_ltv_buffer=False)),
+        ("Only Dynamic CF", specialize_max_debt(use_dynamic_cf=True, use_pessimistic_cap=False, use_ltv_buffer=False)),
+        ("Dynamic + Pessimistic", specialize_max_debt(use_dynamic_cf=True, use_pessimistic_cap=True, use_ltv_buffer=False)),
+        ("Full GAMM", specialize_max_debt(use_dynamic_cf=True, use_pessimistic_cap=True, use_ltv_buffer=True)),
+    )
+
+    for name, max_debt_fn in configs:
+        max_borrow, max_cf, liq_cf = max_debt_fn(collateral, price, price, reserve)
         print(f"{name}:")
         print(f"  Max CF: {max_cf/100}%, Liq CF: {liq_cf/100}%, Max Borrow: ${max_borrow/NAD:,.0f}\n")
 
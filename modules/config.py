@@ -3,6 +3,11 @@ OmniPair GAMM Simulation - Configuration
 Extracted constants from Solana smart contracts
 """
 
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import numpy as np
+
 # ============================================================================
 # CORE CONSTANTS (from constants.rs)
 # ============================================================================
@@ -11,6 +16,7 @@ Extracted constants from Solana smart contracts
 NAD = 1_000_000_000  # 1e9 scaling factor
 NAD_DECIMALS = 9
 BPS_DENOMINATOR = 10_000  # 100% = 10,000 basis points
+NAD_BPS = NAD * BPS_DENOMINATOR  # Fused divisor for value-times-CF steps
 
 # Liquidation Parameters
 CLOSE_FACTOR_BPS = 5_000  # 50% - partial liquidation amount
@@ -40,46 +46,40 @@ FLASHLOAN_FEE_BPS = 5  # 0.05%
 # SIMULATION CONFIGURATION PRESETS
 # ============================================================================
 
+@dataclass(frozen=True, slots=True, repr=False)
 class SimulationConfig:
     """
     Configuration for modular GAMM simulation.
     Each component can be toggled on/off for comparative analysis.
+
+    Frozen with slots: presets are shared module-level singletons, so
+    immutability guards against accidental cross-scenario mutation and
+    instances carry no per-object __dict__.
     """
-    
-    def __init__(
-        self,
-        name: str = "Custom",
-        # Component toggles
-        ema_enabled: bool = True,
-        dynamic_cf_enabled: bool = True,
-        pessimistic_cap_enabled: bool = True,
-        ltv_buffer_enabled: bool = True,
-        partial_liquidation_enabled: bool = True,
-        # Parameters (if components enabled)
-        half_life: int = DEFAULT_HALF_LIFE,
-        fixed_cf_bps: int = 7500,  # 75% if dynamic CF disabled
-        max_cf_bps: int = MAX_COLLATERAL_FACTOR_BPS,
-        ltv_buffer_bps: int = LTV_BUFFER_BPS,
-        close_factor_bps: int = CLOSE_FACTOR_BPS,
-        liquidation_incentive_bps: int = LIQUIDATION_INCENTIVE_BPS,
-    ):
-        self.name = name
-        
-        # Component flags
-        self.ema_enabled = ema_enabled
-        self.dynamic_cf_enabled = dynamic_cf_enabled
-        self.pessimistic_cap_enabled = pessimistic_cap_enabled
-        self.ltv_buffer_enabled = ltv_buffer_enabled
-        self.partial_liquidation_enabled = partial_liquidation_enabled
-        
-        # Parameters
-        self.half_life = half_life
-        self.fixed_cf_bps = fixed_cf_bps
-        self.max_cf_bps = max_cf_bps
-        self.ltv_buffer_bps = ltv_buffer_bps if ltv_buffer_enabled else 0
-        self.close_factor_bps = close_factor_bps if partial_liquidation_enabled else 10_000
-        self.liquidation_incentive_bps = liquidation_incentive_bps
-    
+
+    name: str = "Custom"
+    # Component toggles
+    ema_enabled: bool = True
+    dynamic_cf_enabled: bool = True
+    pessimistic_cap_enabled: bool = True
+    ltv_buffer_enabled: bool = True
+    partial_liquidation_enabled: bool = True
+    # Parameters (if components enabled)
+    half_life: int = DEFAULT_HALF_LIFE
+    fixed_cf_bps: int = 7500  # 75% if dynamic CF disabled
+    max_cf_bps: int = MAX_COLLATERAL_FACTOR_BPS
+    ltv_buffer_bps: int = LTV_BUFFER_BPS
+    close_factor_bps: int = CLOSE_FACTOR_BPS
+    liquidation_incentive_bps: int = LIQUIDATION_INCENTIVE_BPS
+
+    def __post_init__(self):
+        # Disabled components resolve their parameters once at build time
+        # (object.__setattr__ is the sanctioned escape hatch under frozen)
+        if not self.ltv_buffer_enabled:
+            object.__setattr__(self, 'ltv_buffer_bps', 0)
+        if not self.partial_liquidation_enabled:
+            object.__setattr__(self, 'close_factor_bps', 10_000)
+
     def __repr__(self):
         components = []
         if self.ema_enabled:
@@ -184,8 +184,8 @@ AGGRESSIVE_GAMM = SimulationConfig(
 )
 
 
-# All presets for easy iteration
-ALL_PRESETS = [
+# All presets for easy iteration (immutable, like the presets themselves)
+ALL_PRESETS: tuple[SimulationConfig, ...] = (
     TRADITIONAL_LENDING,
     ONLY_EMA,
     ONLY_DYNAMIC_CF,
@@ -193,9 +193,52 @@ ALL_PRESETS = [
     FULL_OMNIPAIR_GAMM,
     CONSERVATIVE_GAMM,
     AGGRESSIVE_GAMM,
-]
+)
+
+PRESET_NAMES: MappingProxyType = MappingProxyType(
+    {preset.name: preset for preset in ALL_PRESETS}
+)
 
-PRESET_NAMES = {preset.name: preset for preset in ALL_PRESETS}
+
+def presets_to_soa() -> dict:
+    """
+    Pack ALL_PRESETS into struct-of-arrays form for vectorized sweeps.
+
+    Returns a dict of parallel arrays in ALL_PRESETS order — bool arrays
+    for the component flags, int64 arrays for the parameters — so sweep
+    drivers can broadcast preset columns against agent arrays (e.g. with
+    pessimistic_max_debt_batch) instead of iterating preset objects.
+
+    Returns:
+        Dict with 'names' (list of str), flag arrays ('ema_enabled',
+        'dynamic_cf_enabled', 'pessimistic_cap_enabled',
+        'ltv_buffer_enabled', 'partial_liquidation_enabled') and
+        parameter arrays ('half_life', 'fixed_cf_bps', 'max_cf_bps',
+        'ltv_buffer_bps', 'close_factor_bps', 'liquidation_incentive_bps')
+    """
+    flag_fields = (
+        'ema_enabled',
+        'dynamic_cf_enabled',
+        'pessimistic_cap_enabled',
+        'ltv_buffer_enabled',
+        'partial_liquidation_enabled',
+    )
+    param_fields = (
+        'half_life',
+        'fixed_cf_bps',
+        'max_cf_bps',
+        'ltv_buffer_bps',
+        'close_factor_bps',
+        'liquidation_incentive_bps',
+    )
+
+    soa = {'names': [preset.name for preset in ALL_PRESETS]}
+    for field in flag_fields:
+        soa[field] = np.array([getattr(p, field) for p in ALL_PRESETS], dtype=bool)
+    for field in param_fields:
+        soa[field] = np.array([getattr(p, field) for p in ALL_PRESETS], dtype=np.int64)
+
+    return soa
 
 
 # ============================================================================
@@ -3,8 +3,13 @@ GAMM Pool State Manager
 Orchestrates all components (EMA, CF, Liquidation) into complete pool simulation
 """
 
+import os
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 from config import (
     NAD, BPS_DENOMINATOR, SimulationConfig, 
     FULL_OMNIPAIR_GAMM, nad_to_float, float_to_nad
@@ -12,9 +17,14 @@ from config import (
 from ema_engine import PriceOracle
 from collateral_factor import CollateralFactorCalculator, pessimistic_max_debt
 from liquidation_engine import LiquidationEngine, calculate_health_factor
+from _hot import (
+    HAS_NUMBA as _HAS_HOT,
+    MAX_INPUT as _HOT_MAX_INPUT,
+    liquidatable_mask as _liquidatable_mask,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class BorrowerPosition:
     """Represents a single borrower's position"""
     id: int
@@ -27,15 +37,21 @@ class BorrowerPosition:
     liquidation_price: Optional[int] = None
     bad_debt_accrued: int = 0
     
-    def get_health_factor(self, collateral_price: int, liquidation_cf_bps: int) -> float:
-        """Calculate current health factor"""
+    def get_health_factor(self, collateral_price: int, liquidation_cf_bps: int) -> int:
+        """
+        Calculate current health factor, in basis points.
+
+        For pool-wide monitoring prefer GAMMPool.get_all_health_factors,
+        which computes every position in one vectorized pass.
+        """
         collateral_value = (self.collateral_amount * collateral_price) // NAD
         return calculate_health_factor(collateral_value, self.debt_amount, liquidation_cf_bps)
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolState:
-    """Snapshot of pool state at a point in time"""
+    """Snapshot of pool state at a point in time
+    (materialized on demand from the structured history rows)"""
     timestamp: int
     reserve_base: int
     reserve_quote: int
@@ -49,6 +65,24 @@ class PoolState:
     protocol_health_pct: float
 
 
+# Row layout for the recorded state history: one contiguous structured
+# array instead of a heap-allocated PoolState per tick (fields mirror
+# PoolState in declaration order)
+STATE_DTYPE = np.dtype([
+    ('timestamp', 'i8'),
+    ('reserve_base', 'i8'),
+    ('reserve_quote', 'i8'),
+    ('total_debt', 'i8'),
+    ('total_collateral', 'i8'),
+    ('spot_price', 'i8'),
+    ('ema_price', 'i8'),
+    ('average_cf_bps', 'i8'),
+    ('active_positions', 'i8'),
+    ('total_bad_debt', 'i8'),
+    ('protocol_health_pct', 'i8'),
+])
+
+
 class GAMMPool:
     """
     Complete GAMM pool simulation with modular configuration.
@@ -61,16 +95,19 @@ class GAMMPool:
         config: SimulationConfig,
         initial_reserve_base: int,
         initial_reserve_quote: int,
-        initial_timestamp: int = 0
+        initial_timestamp: int = 0,
+        reserve_steps: int = 0
     ):
         """
         Initialize GAMM pool.
-        
+
         Args:
             config: Simulation configuration (determines which components are enabled)
             initial_reserve_base: Initial base token reserve (e.g., SOL)
             initial_reserve_quote: Initial quote token reserve (e.g., USDC)
             initial_timestamp: Starting timestamp
+            reserve_steps: Expected tick count; pre-sizes the state
+                history so long runs never reallocate it
         """
         self.config = config
         
@@ -110,15 +147,106 @@ class GAMMPool:
         # Position management
         self.positions: List[BorrowerPosition] = []
         self.next_position_id = 1
+
+        # Struct-of-arrays mirror of the per-position hot fields, kept in
+        # sync with self.positions so CF/health screening runs as one
+        # vectorized pass instead of a Python call per position
+        self._col = np.zeros(16, dtype=np.int64)
+        self._debt = np.zeros(16, dtype=np.int64)
+        self._entry_price = np.zeros(16, dtype=np.int64)
+        self._entry_time = np.zeros(16, dtype=np.int64)
+        self._live = np.zeros(16, dtype=bool)
+        self._n = 0
+        # Compacted index vector over _live, rebuilt lazily only when a
+        # position is created or liquidated; steady-state ticks reuse it
+        self._live_idx: Optional[np.ndarray] = None
+        # Running live count, maintained at the same two mutation points
+        self._active_count = 0
         
-        # Event history
-        self.state_history: List[PoolState] = []
+        # Event history: states live in one preallocated structured
+        # array (see STATE_DTYPE); the state_history property
+        # materializes PoolState views on demand. Liquidation events
+        # stay dicts — they are rare and carry the engine's full result
+        self._state_arr = np.empty(reserve_steps if reserve_steps > 0 else 64,
+                                   dtype=STATE_DTYPE)
+        self._state_len = 0
         self.liquidation_events: List[Dict] = []
-        
+
+        # Per-timestamp price cache: step, check_liquidations and the CF
+        # averaging all need the same (lending, spot) pair, so resolve it
+        # once per tick; any reserve mutation invalidates the entry
+        self._price_cache_ts = -1
+        self._cached_lending = 0
+        self._cached_spot = 0
+
+        # Per-step CF batch cache: the last liquidation pass and the
+        # avg-CF aggregation in step evaluate the same batch for the same
+        # (lending, spot, reserve_quote) over the same live indices, so
+        # the result is kept until any of those inputs moves
+        self._cf_batch_key: Optional[Tuple[int, int, int]] = None
+        self._cf_batch_idx: Optional[np.ndarray] = None
+        self._cf_batch_val: Optional[np.ndarray] = None
+
+        # Config-resolved tick pipeline: partial evaluation via closures,
+        # mirroring specialize_max_debt (no exec codegen). EMA pools bind
+        # the engine update directly; spot pools skip the oracle call
+        oracle_price = self.price_oracle.get_price
+        if config.ema_enabled:
+            def _resolve_tick(spot_price: int, timestamp: int) -> Tuple[int, int]:
+                return (oracle_price(spot_price, timestamp), spot_price)
+        else:
+            def _resolve_tick(spot_price: int, timestamp: int) -> Tuple[int, int]:
+                return (spot_price, spot_price)
+        self._resolve_tick = _resolve_tick
+
         # Initialize price oracle with initial spot price
         initial_spot = self.get_spot_price()
         self.price_oracle.get_price(initial_spot, initial_timestamp)
     
+    @property
+    def state_history(self) -> List[PoolState]:
+        """Recorded per-tick states, materialized as PoolState instances."""
+        return [
+            PoolState(*(int(v) for v in row))
+            for row in self._state_arr[:self._state_len]
+        ]
+
+    def _grow_states(self, needed: int):
+        """Grow the state-history array geometrically to hold `needed` rows."""
+        cap = len(self._state_arr)
+        if needed <= cap:
+            return
+        while cap < needed:
+            cap *= 2
+        grown = np.empty(cap, dtype=STATE_DTYPE)
+        grown[:self._state_len] = self._state_arr[:self._state_len]
+        self._state_arr = grown
+
+    def _live_indices(self) -> np.ndarray:
+        """
+        Indices of live positions, compacted and cached.
+
+        The dead fraction only grows, so gathering through this vector
+        does zero work on liquidated rows; the mask is rescanned only
+        after the live set actually changes.
+        """
+        if self._live_idx is None:
+            self._live_idx = np.flatnonzero(self._live[:self._n])
+        return self._live_idx
+
+    def _grow_arrays(self, needed: int):
+        """Grow the position SoA arrays geometrically to hold `needed` rows."""
+        cap = len(self._col)
+        if needed <= cap:
+            return
+        while cap < needed:
+            cap *= 2
+        for name in ('_col', '_debt', '_entry_price', '_entry_time', '_live'):
+            old = getattr(self, name)
+            grown = np.zeros(cap, dtype=old.dtype)
+            grown[:self._n] = old[:self._n]
+            setattr(self, name, grown)
+
     def get_spot_price(self) -> int:
         """
         Calculate spot price from reserves: quote/base
@@ -130,31 +258,96 @@ class GAMMPool:
             return 0
         return (self.reserve_quote * NAD) // self.reserve_base
     
+    def _invalidate_price_cache(self):
+        """Drop the cached (lending, spot) pair after a reserve mutation."""
+        self._price_cache_ts = -1
+
+    def _get_prices(self, timestamp: int) -> Tuple[int, int]:
+        """
+        Resolve (lending_price, spot_price) for this timestamp, cached.
+
+        The oracle update is idempotent within a tick (dt == 0 returns the
+        last EMA), so serving repeat calls from the cache is exact.
+
+        Args:
+            timestamp: Current timestamp
+
+        Returns:
+            Tuple of (lending_price, spot_price), both NAD-scaled
+        """
+        if timestamp == self._price_cache_ts:
+            return self._cached_lending, self._cached_spot
+
+        spot = self.get_spot_price()
+        lending, _ = self._resolve_tick(spot, timestamp)
+        self._price_cache_ts = timestamp
+        self._cached_lending = lending
+        self._cached_spot = spot
+        return lending, spot
+
+    def _liq_cf_batch(
+        self,
+        idx: np.ndarray,
+        lending_price: int,
+        spot_price: int
+    ) -> np.ndarray:
+        """
+        Liquidation CF batch over position indices, memoized per step.
+
+        CF depends only on (collateral, lending, spot, reserve_quote);
+        the collateral of a live position only changes through events
+        that also move reserve_quote or the live set, so matching the
+        (prices, reserve_quote) key and the index vector guarantees the
+        cached batch is exact.
+
+        Args:
+            idx: Position indices to evaluate (int64 array)
+            lending_price: Lending price (NAD-scaled)
+            spot_price: Spot price (NAD-scaled)
+
+        Returns:
+            Liquidation CF per index in bps (int64 array; do not mutate)
+        """
+        key = (lending_price, spot_price, self.reserve_quote)
+        if key == self._cf_batch_key and np.array_equal(idx, self._cf_batch_idx):
+            return self._cf_batch_val
+
+        _, _, liq_cf = self.cf_calculator.calculate_batch(
+            self._col[idx], lending_price, spot_price, self.reserve_quote
+        )
+        self._cf_batch_key = key
+        self._cf_batch_idx = idx
+        self._cf_batch_val = liq_cf
+        return liq_cf
+
     def get_lending_price(self, timestamp: int) -> int:
         """
         Get price used for lending calculations (EMA or spot based on config).
-        
+
         Args:
             timestamp: Current timestamp
-        
+
         Returns:
             Lending price (NAD-scaled)
         """
-        spot = self.get_spot_price()
-        return self.price_oracle.get_price(spot, timestamp)
-    
+        return self._get_prices(timestamp)[0]
+
     def update_reserves_from_price(self, new_price: int):
         """
         Update reserves to reflect new price (simulates AMM trades).
         
         In real AMM, trades change reserves. For simulation, we can
         adjust reserves to match target price.
-        
+
+        step inlines this adjustment; call it only when external code
+        needs the reserves moved outside the tick loop.
+
         Args:
             new_price: Target price (NAD-scaled)
         """
         # Keep base reserve constant, adjust quote reserve
         self.reserve_quote = (self.reserve_base * new_price) // NAD
+        self._invalidate_price_cache()
     
     def create_position(
         self,
@@ -174,9 +367,8 @@ class GAMMPool:
             New BorrowerPosition
         """
         # Get current price
-        lending_price = self.get_lending_price(timestamp)
-        spot_price = self.get_spot_price()
-        
+        lending_price, spot_price = self._get_prices(timestamp)
+
         # Calculate maximum borrow amount
         max_borrow, max_cf_bps, liq_cf_bps = self.cf_calculator.calculate(
             collateral_amount,
@@ -199,85 +391,144 @@ class GAMMPool:
         
         self.next_position_id += 1
         self.positions.append(position)
-        
+
+        # Mirror into the SoA arrays
+        self._grow_arrays(self._n + 1)
+        self._col[self._n] = collateral_amount
+        self._debt[self._n] = actual_borrow
+        self._entry_price[self._n] = lending_price
+        self._entry_time[self._n] = timestamp
+        self._live[self._n] = True
+        self._n += 1
+        self._live_idx = None
+        self._active_count += 1
+
+
         # Update pool state
         self.total_debt += actual_borrow
         self.total_collateral_base += collateral_amount
         
         # Reduce available reserves (debt is borrowed out)
         self.reserve_quote = max(0, self.reserve_quote - actual_borrow)
-        
+        self._invalidate_price_cache()
+
+
         return position
     
-    def check_liquidations(self, timestamp: int) -> List[Dict]:
+    def check_liquidations(
+        self,
+        timestamp: int,
+        lending_price: Optional[int] = None,
+        spot_price: Optional[int] = None
+    ) -> List[Dict]:
         """
         Check all positions for liquidation and execute if needed.
-        
+
         Args:
             timestamp: Current timestamp
-        
+            lending_price: Pre-resolved lending price; fetched when omitted
+            spot_price: Pre-resolved spot price; fetched when omitted
+
         Returns:
             List of liquidation event dictionaries
         """
         liquidations = []
-        lending_price = self.get_lending_price(timestamp)
-        spot_price = self.get_spot_price()
-        
-        for position in self.positions:
-            if position.liquidated:
-                continue
-            
-            # Get liquidation CF for this position
-            _, _, liq_cf_bps = self.cf_calculator.calculate(
-                position.collateral_amount,
-                lending_price,
-                spot_price,
-                self.reserve_quote
-            )
-            
-            # Check liquidation
-            result = self.liquidation_engine.check_and_liquidate(
-                position.collateral_amount,
-                lending_price,
-                position.debt_amount,
-                liq_cf_bps
-            )
-            
-            if result["liquidatable"]:
-                # Execute liquidation
-                position.liquidated = True
-                position.liquidation_time = timestamp
-                position.liquidation_price = lending_price
-                position.bad_debt_accrued = result["bad_debt"]
-                
-                # Update position state
-                position.collateral_amount = result["remaining_collateral"]
-                position.debt_amount = result["remaining_debt"]
-                
-                # Update pool state
-                self.total_debt -= result["debt_to_repay"]
-                self.total_collateral_base -= result["collateral_seized"]
-                
-                # Collateral seized goes back to reserves
-                # (minus liquidator bonus which leaves the system)
-                self.reserve_base += result["collateral_to_reserves"]
-                
-                # Debt repaid goes back to reserves
-                self.reserve_quote += result["debt_to_repay"]
-                
-                # Record event
-                event = {
-                    "timestamp": timestamp,
-                    "position_id": position.id,
-                    "price": lending_price,
-                    "spot_price": spot_price,
-                    "ema_price": lending_price if self.config.ema_enabled else spot_price,
-                    **result
-                }
-                
-                liquidations.append(event)
-                self.liquidation_events.append(event)
-        
+        if lending_price is None or spot_price is None:
+            lending_price, spot_price = self._get_prices(timestamp)
+
+        # Hot loop: pin the per-position lookups to locals
+        positions = self.positions
+        liq_cf_batch = self._liq_cf_batch
+        check_and_liquidate = self.liquidation_engine.check_and_liquidate
+
+        live_idx = self._live_indices()
+        pos = 0
+        while pos < len(live_idx):
+            # One vectorized CF pass over the remaining live positions.
+            # A liquidation changes reserve_quote, which feeds back into
+            # the CF of positions screened after it, so the batch is
+            # recomputed past the liquidated index — results stay
+            # identical to the original per-position loop.
+            remaining = live_idx[pos:]
+            liq_cf_arr = liq_cf_batch(remaining, lending_price, spot_price)
+
+            # Cheap exact pre-screen: the compiled predicate mirrors
+            # calculate_liquidation's liquidatable test, so healthy
+            # positions never reach the full engine path. Falls back to
+            # checking everything when inputs exceed the kernel range
+            cols = self._col[remaining]
+            if _HAS_HOT and lending_price < _HOT_MAX_INPUT and (
+                    len(cols) == 0 or int(cols.max()) < _HOT_MAX_INPUT):
+                mask = np.empty(len(remaining), dtype=np.bool_)
+                _liquidatable_mask(
+                    cols, self._debt[remaining], liq_cf_arr, lending_price, mask
+                )
+                candidates = np.flatnonzero(mask)
+            else:
+                candidates = range(len(remaining))
+
+            liquidated_in_pass = False
+            for j in candidates:
+                i = remaining[j]
+                position = positions[i]
+
+                # Check liquidation
+                result = check_and_liquidate(
+                    position.collateral_amount,
+                    lending_price,
+                    position.debt_amount,
+                    int(liq_cf_arr[j])
+                )
+
+                if result["liquidatable"]:
+                    # Execute liquidation
+                    position.liquidated = True
+                    position.liquidation_time = timestamp
+                    position.liquidation_price = lending_price
+                    position.bad_debt_accrued = result["bad_debt"]
+
+                    # Update position state
+                    position.collateral_amount = result["remaining_collateral"]
+                    position.debt_amount = result["remaining_debt"]
+                    self._col[i] = result["remaining_collateral"]
+                    self._debt[i] = result["remaining_debt"]
+                    self._live[i] = False
+                    self._live_idx = None
+                    self._active_count -= 1
+
+                    # Update pool state
+                    self.total_debt -= result["debt_to_repay"]
+                    self.total_collateral_base -= result["collateral_seized"]
+
+                    # Collateral seized goes back to reserves
+                    # (minus liquidator bonus which leaves the system)
+                    self.reserve_base += result["collateral_to_reserves"]
+
+                    # Debt repaid goes back to reserves
+                    self.reserve_quote += result["debt_to_repay"]
+                    self._invalidate_price_cache()
+
+                    # Record event
+                    event = {
+                        "timestamp": timestamp,
+                        "position_id": position.id,
+                        "price": lending_price,
+                        "spot_price": spot_price,
+                        "ema_price": lending_price if self.config.ema_enabled else spot_price,
+                        **result
+                    }
+
+                    liquidations.append(event)
+                    self.liquidation_events.append(event)
+
+                    # Reserves moved: recompute CF for the rest
+                    pos += j + 1
+                    liquidated_in_pass = True
+                    break
+
+            if not liquidated_in_pass:
+                break
+
         return liquidations
     
     def step(self, new_price: int, timestamp: int) -> PoolState:
@@ -293,76 +544,186 @@ class GAMMPool:
         """
         # Update time
         self.current_time = timestamp
-        
-        # Update reserves to reflect new price
-        self.update_reserves_from_price(new_price)
-        
+        nad = NAD
+
+        # Update reserves to reflect new price. The spot price a reserve
+        # roundtrip would hand back is new_price itself (modulo a floor-
+        # division wobble), so assign it directly instead of recomputing
+        # quote * NAD // base
+        self.reserve_quote = (self.reserve_base * new_price) // nad
+        spot_price = new_price
+
         # Update lending price (triggers EMA update if enabled)
-        lending_price = self.get_lending_price(timestamp)
-        spot_price = self.get_spot_price()
-        
+        lending_price, _ = self._resolve_tick(spot_price, timestamp)
+        self._price_cache_ts = timestamp
+        self._cached_lending = lending_price
+        self._cached_spot = spot_price
+
         # Check and execute liquidations
-        self.check_liquidations(timestamp)
+        self.check_liquidations(timestamp, lending_price, spot_price)
         
-        # Calculate average CF across active positions
-        active_positions = [p for p in self.positions if not p.liquidated]
-        if active_positions:
-            total_cf = 0
-            for pos in active_positions:
-                _, _, liq_cf = self.cf_calculator.calculate(
-                    pos.collateral_amount,
-                    lending_price,
-                    spot_price,
-                    self.reserve_quote
-                )
-                total_cf += liq_cf
-            avg_cf = total_cf // len(active_positions)
+        # Calculate average CF across active positions. On quiet ticks
+        # the final liquidation pass already evaluated this exact batch,
+        # so _liq_cf_batch serves it from the per-step cache
+        live_idx = self._live_indices()
+        if len(live_idx):
+            liq_cf_arr = self._liq_cf_batch(live_idx, lending_price, spot_price)
+            avg_cf = int(liq_cf_arr.sum()) // len(live_idx)
         else:
             avg_cf = 0
         
-        # Calculate protocol health
-        total_collateral_value = (self.total_collateral_base * lending_price) // NAD
-        if self.total_debt > 0:
-            protocol_health = ((total_collateral_value - self.total_debt) * 100) // self.total_debt
+        # Calculate protocol health (totals read once; NAD already local)
+        total_debt = self.total_debt
+        total_collateral_value = (self.total_collateral_base * lending_price) // nad
+        if total_debt > 0:
+            protocol_health = ((total_collateral_value - total_debt) * 100) // total_debt
         else:
             protocol_health = 999
         
-        # Create state snapshot
-        state = PoolState(
-            timestamp=timestamp,
-            reserve_base=self.reserve_base,
-            reserve_quote=self.reserve_quote,
-            total_debt=self.total_debt,
-            total_collateral=self.total_collateral_base,
-            spot_price=spot_price,
-            ema_price=lending_price,
-            average_cf_bps=avg_cf,
-            active_positions=len(active_positions),
-            total_bad_debt=self.liquidation_engine.total_bad_debt,
-            protocol_health_pct=protocol_health
+        # Record state snapshot (contiguous row write, no per-tick object)
+        row = (
+            timestamp,
+            self.reserve_base,
+            self.reserve_quote,
+            total_debt,
+            self.total_collateral_base,
+            spot_price,
+            lending_price,
+            avg_cf,
+            len(live_idx),
+            self.liquidation_engine.total_bad_debt,
+            protocol_health,
         )
-        
-        self.state_history.append(state)
+        self._grow_states(self._state_len + 1)
+        self._state_arr[self._state_len] = row
+        self._state_len += 1
         self.last_update = timestamp
-        
-        return state
+
+        return PoolState(*row)
     
+    def get_all_health_factors(self, timestamp: int) -> np.ndarray:
+        """
+        Health factor for every position in one vectorized pass.
+
+        Liquidation monitoring wants all HFs at once rather than a
+        get_health_factor call per position, so this computes them from
+        the SoA mirrors with a single batch CF evaluation. Semantics
+        match calculate_health_factor elementwise: borrow limit over
+        debt in integer bps, 999 * BPS_DENOMINATOR where there is no
+        debt.
+
+        Args:
+            timestamp: Current timestamp (resolves lending/spot prices)
+
+        Returns:
+            int64 bps array indexed like self.positions
+        """
+        lending_price, spot_price = self._get_prices(timestamp)
+        n = self._n
+        _, _, liq_cf = self.cf_calculator.calculate_batch(
+            self._col[:n], lending_price, spot_price, self.reserve_quote
+        )
+
+        # Borrow limits on object arrays (products exceed int64)
+        borrow_limit = (
+            self._col[:n].astype(object) * lending_price // NAD
+        ) * liq_cf.astype(object) // BPS_DENOMINATOR
+
+        debt = self._debt[:n]
+        safe_debt = np.where(debt > 0, debt, 1).astype(object)
+        return np.where(
+            debt > 0,
+            borrow_limit * BPS_DENOMINATOR // safe_debt,
+            999 * BPS_DENOMINATOR
+        ).astype(np.int64)
+
+    def replay_prices(self, price_data: List[Tuple[int, int]]) -> Optional[PoolState]:
+        """
+        Advance the pool through a whole (timestamp, price) series.
+
+        Quiet pools — no outstanding debt and no live positions — take a
+        batch path: reserve and spot trajectories are computed in bulk
+        and the EMA advances through one EMAEngine.batch_update call,
+        skipping the per-tick liquidation machinery while matching step
+        tick for tick. Pools with activity fall back to the scalar step
+        loop, which liquidation feedback requires.
+
+        Args:
+            price_data: List of (timestamp, price_nad) tuples
+
+        Returns:
+            Final pool state, or None for an empty series
+        """
+        if len(price_data) == 0:
+            return None
+
+        if self.total_debt > 0 or self._live[:self._n].any():
+            state = None
+            for timestamp, price in price_data:
+                state = self.step(int(price), int(timestamp))
+            return state
+
+        timestamps = [int(t) for t, _ in price_data]
+        prices = np.asarray([int(p) for _, p in price_data], dtype=object)
+
+        # Same fused reserve update as step: quote follows the price and
+        # the price itself is the spot (object arrays for exactness)
+        reserve_base = self.reserve_base
+        quotes = reserve_base * prices // NAD
+        spots = prices
+
+        if self.config.ema_enabled:
+            lendings = self.price_oracle.ema_engine.batch_update(
+                spots.astype(np.int64), timestamps
+            ).tolist()
+        else:
+            lendings = spots.tolist()
+
+        # Bulk column writes into the preallocated state array
+        n = len(timestamps)
+        self._grow_states(self._state_len + n)
+        rows = self._state_arr[self._state_len:self._state_len + n]
+        rows['timestamp'] = timestamps
+        rows['reserve_base'] = reserve_base
+        rows['reserve_quote'] = np.asarray(quotes.tolist(), dtype=np.int64)
+        rows['total_debt'] = 0
+        rows['total_collateral'] = self.total_collateral_base
+        rows['spot_price'] = np.asarray(spots.tolist(), dtype=np.int64)
+        rows['ema_price'] = lendings
+        rows['average_cf_bps'] = 0
+        rows['active_positions'] = 0
+        rows['total_bad_debt'] = self.liquidation_engine.total_bad_debt
+        rows['protocol_health_pct'] = 999
+        self._state_len += n
+        state = PoolState(*(int(v) for v in rows[-1]))
+
+        self.reserve_quote = int(quotes[-1])
+        self.current_time = timestamps[-1]
+        self.last_update = timestamps[-1]
+        self._invalidate_price_cache()
+        return state
+
     def get_statistics(self) -> Dict:
         """Get comprehensive pool statistics"""
-        active_positions = [p for p in self.positions if not p.liquidated]
-        liquidated_positions = [p for p in self.positions if p.liquidated]
-        
-        total_borrowed = sum(p.debt_amount for p in self.positions)
-        total_collateral_value = sum(
-            (p.collateral_amount * p.entry_price) // NAD 
-            for p in self.positions
+        nad = NAD
+        positions = self.positions
+        active_count = self._active_count
+        liquidated_count = len(positions) - active_count
+
+        # Native reductions over the SoA mirrors; the collateral-value
+        # product exceeds int64, so that pass runs on object (bigint)
+        # arrays to stay exact
+        n = self._n
+        total_borrowed = int(self._debt[:n].sum())
+        total_collateral_value = int(
+            (self._col[:n].astype(object) * self._entry_price[:n].astype(object) // nad).sum()
         )
         
         return {
             "config_name": self.config.name,
-            "total_positions": len(self.positions),
-            "active_positions": len(active_positions),
-            "liquidated_positions": len(liquidated_positions),
+            "total_positions": len(positions),
+            "active_positions": active_count,
+            "liquidated_positions": liquidated_count,
             "total_borrowed": total_borrowed,
             "total_bad_debt": self.liquidation_engine.total_bad_debt,
             "bad_debt_rate_bps": (
@@ -370,7 +731,10 @@ class GAMMPool:
                 if total_borrowed > 0 else 0
             ),
             "total_liquidations": self.liquidation_engine.total_liquidations,
-            "protocol_health_final": self.state_history[-1].protocol_health_pct if self.state_history else 0,
+            "protocol_health_final": (
+                int(self._state_arr[self._state_len - 1]['protocol_health_pct'])
+                if self._state_len else 0
+            ),
             "liquidation_events": len(self.liquidation_events),
         }
     
@@ -384,18 +748,19 @@ class GAMMPool:
         Returns:
             Return percentage (e.g., 0.05 = 5% gain, -0.10 = 10% loss)
         """
-        if not self.state_history:
+        if not self._state_len:
             return 0.0
-        
-        final_state = self.state_history[-1]
-        
+
+        final_state = self._state_arr[self._state_len - 1]
+        ema_price = int(final_state['ema_price'])
+
         # Pool value = reserves + collateral - debt - bad_debt
         final_pool_value = (
-            final_state.reserve_base * final_state.ema_price // NAD +
-            final_state.reserve_quote +
-            final_state.total_collateral * final_state.ema_price // NAD -
-            final_state.total_debt -
-            final_state.total_bad_debt
+            int(final_state['reserve_base']) * ema_price // NAD +
+            int(final_state['reserve_quote']) +
+            int(final_state['total_collateral']) * ema_price // NAD -
+            int(final_state['total_debt']) -
+            int(final_state['total_bad_debt'])
         )
         
         if initial_lp_value == 0:
@@ -413,24 +778,30 @@ def simulate_scenario(
     price_data: List[Tuple[int, int]],  # List of (timestamp, price)
     initial_pool_tvl: int,
     borrower_positions: List[Dict],  # List of {ltv: float, collateral: int}
+    return_pool: bool = True,
 ) -> Dict:
     """
     Run complete scenario simulation.
-    
+
     Args:
         config: Simulation configuration
         price_data: List of (timestamp, price_nad) tuples
         initial_pool_tvl: Initial pool TVL in quote token
         borrower_positions: List of borrower configs
-    
+        return_pool: Include the live pool object in the result; set
+            False when results must cross a process boundary (the pool
+            holds bound closures and does not pickle)
+
     Returns:
         Complete results dictionary
     """
-    if not price_data:
+    if len(price_data) == 0:
         return {"error": "No price data provided"}
-    
-    # Initialize pool
+
+    # Initialize pool (int() at the boundary: rows may carry np.int64
+    # scalars, which would silently overflow in the NAD-scaled products)
     initial_timestamp, initial_price = price_data[0]
+    initial_timestamp = int(initial_timestamp)
     initial_base = initial_pool_tvl  # In quote units
     initial_quote = initial_pool_tvl
     
@@ -438,7 +809,8 @@ def simulate_scenario(
         config=config,
         initial_reserve_base=initial_base,
         initial_reserve_quote=initial_quote,
-        initial_timestamp=initial_timestamp
+        initial_timestamp=initial_timestamp,
+        reserve_steps=len(price_data)
     )
     
     # Create borrower positions
@@ -451,42 +823,71 @@ def simulate_scenario(
     
     # Step through price data
     for timestamp, price in price_data[1:]:
-        pool.step(price, timestamp)
+        pool.step(int(price), int(timestamp))
     
     # Gather results
     stats = pool.get_statistics()
     initial_lp_value = initial_pool_tvl * 2  # Base + quote
     lp_return = pool.get_final_lp_return(initial_lp_value)
     
-    return {
+    result = {
         **stats,
         "lp_return_pct": lp_return * 100,
         "state_history": pool.state_history,
         "liquidation_events": pool.liquidation_events,
-        "pool": pool  # Return pool object for further analysis
     }
+    if return_pool:
+        result["pool"] = pool  # Return pool object for further analysis
+    return result
 
 
 def compare_configurations(
     configs: List[SimulationConfig],
     price_data: List[Tuple[int, int]],
     initial_pool_tvl: int,
-    borrower_positions: List[Dict]
+    borrower_positions: List[Dict],
+    max_workers: Optional[int] = None
 ) -> Dict[str, Dict]:
     """
     Run same scenario with multiple configurations and compare.
-    
+
+    Each configuration is independent, so with max_workers > 1 the
+    simulations fan out across processes; parallel results omit the
+    live pool object, which cannot cross the process boundary.
+
     Args:
         configs: List of configurations to test
         price_data: Price time series
         initial_pool_tvl: Initial pool size
         borrower_positions: Borrower setup
-    
+        max_workers: Process count for parallel execution; None or 1
+            runs serially in-process (default)
+
     Returns:
-        Dictionary mapping config name to results
+        Dictionary mapping config name to results, in configs order
     """
+    if max_workers is not None and max_workers > 1 and len(configs) > 1:
+        workers = min(max_workers, len(configs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                config.name: executor.submit(
+                    simulate_scenario,
+                    config,
+                    price_data,
+                    initial_pool_tvl,
+                    borrower_positions,
+                    False,  # return_pool: pools stay in the workers
+                )
+                for config in configs
+            }
+            results = {}
+            for name, future in futures.items():
+                print(f"Running simulation: {name}...")
+                results[name] = future.result()
+            return results
+
     results = {}
-    
+
     for config in configs:
         print(f"Running simulation: {config.name}...")
         result = simulate_scenario(
@@ -496,7 +897,7 @@ def compare_configurations(
             borrower_positions=borrower_positions
         )
         results[config.name] = result
-    
+
     return results
 
 
@@ -622,6 +1023,67 @@ def test_liquidation_scenario():
     print(f"   Bad debt: ${nad_to_float(position.bad_debt_accrued):.2f}")
 
 
+def test_all_health_factors():
+    """Test vectorized HF pass matches per-position calculation"""
+    from config import FULL_OMNIPAIR_GAMM
+
+    pool = GAMMPool(
+        config=FULL_OMNIPAIR_GAMM,
+        initial_reserve_base=10_000 * NAD,
+        initial_reserve_quote=10_000 * NAD,
+        initial_timestamp=0
+    )
+    for ltv in (0.5, 0.75, 0.9):
+        pool.create_position(100 * NAD, ltv, 0)
+
+    ts = 60
+    hfs = pool.get_all_health_factors(ts)
+    lending_price, spot_price = pool._get_prices(ts)
+
+    assert len(hfs) == 3
+    for i, position in enumerate(pool.positions):
+        _, _, liq_cf = pool.cf_calculator.calculate(
+            position.collateral_amount, lending_price, spot_price, pool.reserve_quote
+        )
+        expected = position.get_health_factor(lending_price, liq_cf)
+        assert hfs[i] == expected, f"HF mismatch at {i}: {hfs[i]} != {expected}"
+
+    print("✅ Vectorized health factors match per-position calculation")
+
+
+def test_replay_matches_step():
+    """Test batch replay produces the same states as per-tick stepping"""
+    from config import FULL_OMNIPAIR_GAMM
+
+    price_data = [
+        (60, int(1.1 * NAD)),
+        (120, int(0.9 * NAD)),
+        (180, int(0.95 * NAD)),
+        (240, int(1.3 * NAD)),
+    ]
+
+    def make_pool():
+        return GAMMPool(
+            config=FULL_OMNIPAIR_GAMM,
+            initial_reserve_base=1_000 * NAD,
+            initial_reserve_quote=1_000 * NAD,
+            initial_timestamp=0
+        )
+
+    stepped = make_pool()
+    for ts, price in price_data:
+        stepped.step(price, ts)
+
+    replayed = make_pool()
+    replayed.replay_prices(price_data)
+
+    assert replayed.state_history == stepped.state_history, \
+        "Replay states should match per-tick stepping exactly"
+    assert replayed.reserve_quote == stepped.reserve_quote
+
+    print("✅ Replay matches per-tick stepping")
+
+
 def test_configuration_comparison():
     """Test comparing multiple configurations"""
     from config import TRADITIONAL_LENDING, FULL_OMNIPAIR_GAMM
@@ -663,6 +1125,8 @@ def run_all_tests():
     test_position_creation()
     test_price_movement()
     test_liquidation_scenario()
+    test_all_health_factors()
+    test_replay_matches_step()
     test_configuration_comparison()
     print("\n✅ All pool tests passed!\n")
 
@@ -3,17 +3,33 @@ Run Complete Scenario Analysis
 Tests all configurations against all three crisis scenarios
 """
 
+import os
+
+# Shared on-disk cache for the compiled kernels so repeated runs (and
+# CI) load machine code instead of re-JITting; must be set before any
+# module imports numba
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".numba_cache"),
+)
+
 from config import (
     TRADITIONAL_LENDING, ONLY_EMA, ONLY_DYNAMIC_CF, 
     EMA_PLUS_DYNAMIC_CF, FULL_OMNIPAIR_GAMM, 
     CONSERVATIVE_GAMM, AGGRESSIVE_GAMM,
     nad_to_float, float_to_nad
 )
-from gamm_pool import compare_configurations, simulate_scenario
+from gamm_pool import simulate_scenario
 from data_collector import load_price_data_csv
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import json
 
+try:
+    import orjson  # optional; serializes the results dump in C
+except ImportError:
+    orjson = None
+
 
 def run_complete_analysis():
     """
@@ -68,42 +84,59 @@ def run_complete_analysis():
     ]
     
     all_results = {}
-    
-    # Run each scenario
+
+    # Load price data up front so workers receive arrays instead of
+    # each re-parsing the CSVs
+    runnable = []
     for scenario in scenarios:
-        print(f"\n{'='*80}")
-        print(f"📊 SCENARIO: {scenario['name']}")
-        print(f"   {scenario['description']}")
-        print(f"{'='*80}\n")
-        
         # Check if data file exists
         filepath = Path(scenario['file'])
         if not filepath.exists():
             print(f"❌ Data file not found: {filepath}")
             print(f"   Run: python create_synthetic_data.py")
             continue
-        
-        # Load price data
+
         try:
             price_data = load_price_data_csv(str(filepath))
-            print(f"✅ Loaded {len(price_data)} price points")
+            print(f"✅ Loaded {len(price_data)} price points for {scenario['name']}")
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             continue
-        
-        # Run simulations
-        print(f"\n🔄 Running simulations with {len(configs)} configurations...\n")
-        
-        results = compare_configurations(
-            configs=configs,
-            price_data=price_data,
-            initial_pool_tvl=scenario['initial_tvl'],
-            borrower_positions=scenario['borrowers']
-        )
-        
-        all_results[scenario['name']] = results
-        
-        # Print results
+
+        runnable.append((scenario, price_data))
+
+    # Every (scenario, config) pair is independent: fan them all out
+    # across one process pool (workers keep the live pool objects, only
+    # the result dicts cross back)
+    workers = min(os.cpu_count() or 1, len(runnable) * len(configs) or 1)
+    print(f"\n🔄 Running {len(runnable) * len(configs)} simulations "
+          f"across {workers} processes...\n")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            (scenario['name'], config.name): executor.submit(
+                simulate_scenario,
+                config,
+                price_data,
+                scenario['initial_tvl'],
+                scenario['borrowers'],
+                False,
+            )
+            for scenario, price_data in runnable
+            for config in configs
+        }
+        for (scenario_name, config_name), future in futures.items():
+            all_results.setdefault(scenario_name, {})[config_name] = future.result()
+
+    # Print results per scenario
+    for scenario, _ in runnable:
+        print(f"\n{'='*80}")
+        print(f"📊 SCENARIO: {scenario['name']}")
+        print(f"   {scenario['description']}")
+        print(f"{'='*80}\n")
+
+        results = all_results[scenario['name']]
+
         print(f"\n{'─'*80}")
         print(f"📈 RESULTS: {scenario['name']}")
         print(f"{'─'*80}\n")
@@ -208,8 +241,15 @@ def run_complete_analysis():
             for config_name, result in results.items()
         }
     
-    with open(output_file, 'w') as f:
-        json.dump(results_for_save, f, indent=2)
+    # Serialization happens once here, after the simulations finish;
+    # orjson emits the same two-space-indented bytes as the stdlib
+    # encoder for this payload, just without the per-token Python loop
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results_for_save, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(results_for_save, f, indent=2)
     
     print(f"\n\n💾 Results saved to: {output_file}")
     